@@ -3,9 +3,11 @@
 Provides thread-safe data stream context management and unified emit interface.
 """
 
-import uuid
-from contextvars import ContextVar
-from typing import Optional, Dict, Any, Union, List
+import os
+from collections import deque
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Optional, Dict, Any, Union, List, Callable, Awaitable, Deque
 
 # Global context variable - using ContextVar for thread safety
 # ContextVar is provided by Python 3.7+ for async and multi-threaded environments
@@ -22,6 +24,57 @@ _context_operations_count: ContextVar[int] = ContextVar(
 )
 
 
+# Generated IDs are cut from one os.urandom() read per _ID_BATCH IDs instead of
+# building a uuid.UUID and reading urandom for each one
+_ID_BATCH = 64
+_id_pool: Deque[str] = deque()
+
+
+def _random_id() -> str:
+    """Return a random ID in the same form as uuid.uuid4().hex."""
+    if not _id_pool:
+        data = os.urandom(16 * _ID_BATCH).hex()
+        # Set the version (4) and RFC 4122 variant bits of each 32-character slice
+        _id_pool.extend(
+            f"{data[i:i + 12]}4{data[i + 13:i + 16]}"
+            f"{'89ab'[int(data[i + 16], 16) & 3]}{data[i + 17:i + 32]}"
+            for i in range(0, len(data), 32)
+        )
+    return _id_pool.popleft()
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the IDs left in its parent's pool
+    os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+def _skip_without_stream(
+    emit: Callable[..., Awaitable[bool]]
+) -> Callable[..., Awaitable[bool]]:
+    """Return False straight away when no data stream is set.
+    
+    Emitters build their chunk (often with generated IDs) before emit_data
+    finds out there is nowhere to send it; tools that emit while running
+    without auto_context would pay for that on every call.
+    """
+    @wraps(emit)
+    async def wrapper(*args: Any, **kwargs: Any) -> bool:
+        if _current_data_stream.get() is None:
+            return False
+        return await emit(*args, **kwargs)
+    return wrapper
+
+
+def _stream_message_id() -> str:
+    """Message ID for emitters called without one.
+    
+    Chunks belong to the message of the current stream, so its ID is reused
+    instead of minting a new UUID for every emitted chunk.
+    """
+    message_id = getattr(_current_data_stream.get(), "message_id", None)
+    return message_id or _random_id()
+
+
 class DataStreamContext:
     """Unified data stream context manager.
     
@@ -31,13 +84,17 @@ class DataStreamContext:
     # ==================== Context Management ====================
     
     @staticmethod
-    def set_current_stream(stream: 'DataStreamWithEmitters') -> None:
+    def set_current_stream(stream: 'DataStreamWithEmitters') -> Token:
         """Set current data stream.
         
         Args:
             stream: DataStreamWithEmitters instance
+            
+        Returns:
+            Token that restores the previously current stream when passed
+            to clear_current_stream
         """
-        _current_data_stream.set(stream)
+        return _current_data_stream.set(stream)
     
     @staticmethod
     def get_current_stream() -> Optional['DataStreamWithEmitters']:
@@ -49,8 +106,22 @@ class DataStreamContext:
         return _current_data_stream.get()
     
     @staticmethod
-    def clear_current_stream() -> None:
-        """Clear current data stream."""
+    def clear_current_stream(token: Optional[Token] = None) -> None:
+        """Clear current data stream.
+        
+        Args:
+            token: Token returned by set_current_stream. When given, the stream
+                that was current before that call is restored; otherwise the
+                current stream is unset.
+        """
+        if token is not None:
+            try:
+                _current_data_stream.reset(token)
+                return
+            except ValueError:
+                # Token belongs to another context (e.g. the generator is being
+                # finalized from a different task); fall back to unsetting
+                pass
         _current_data_stream.set(None)
     
     @staticmethod
@@ -87,21 +158,23 @@ class DataStreamContext:
     # ==================== Message Lifecycle ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_start(message_id: Optional[str] = None) -> bool:
         """Send start message.
         
         Args:
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "start",
-            "messageId": message_id or str(uuid.uuid4())
+            "messageId": message_id or _stream_message_id()
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_finish(
         message_id: Optional[str] = None,
         finish_reason: str = "stop",
@@ -110,7 +183,7 @@ class DataStreamContext:
         """Send finish message.
         
         Args:
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             finish_reason: Finish reason, defaults to "stop"
             usage: Usage statistics
             
@@ -119,7 +192,7 @@ class DataStreamContext:
         """
         data = {
             "type": "finish",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "finishReason": finish_reason
         }
         if usage:
@@ -128,6 +201,7 @@ class DataStreamContext:
         return await DataStreamContext.emit_data(data)
     
     @staticmethod
+    @_skip_without_stream
     async def emit_message_start(
         role: str,
         message_id: Optional[str] = None
@@ -136,35 +210,37 @@ class DataStreamContext:
         
         Args:
             role: Message role (user, assistant, system)
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "message-start",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "role": role
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_message_end(message_id: Optional[str] = None) -> bool:
         """Send message end.
         
         Args:
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "message-end",
-            "messageId": message_id or str(uuid.uuid4())
+            "messageId": message_id or _stream_message_id()
         })
     
     # ==================== Text Processing ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_text_start(
         text_id: Optional[str] = None,
         message_id: Optional[str] = None
@@ -173,18 +249,19 @@ class DataStreamContext:
         
         Args:
             text_id: Text ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "text-start",
-            "id": text_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4())
+            "id": text_id or _random_id(),
+            "messageId": message_id or _stream_message_id()
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_text_delta(
         text_delta: str,
         text_id: Optional[str] = None,
@@ -195,19 +272,20 @@ class DataStreamContext:
         Args:
             text_delta: Text delta content
             text_id: Text ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "text-delta",
-            "id": text_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4()),
+            "id": text_id or _random_id(),
+            "messageId": message_id or _stream_message_id(),
             "textDelta": text_delta
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_text_end(
         text: str,
         text_id: Optional[str] = None,
@@ -218,21 +296,22 @@ class DataStreamContext:
         Args:
             text: Complete text content
             text_id: Text ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "text-end",
-            "id": text_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4()),
+            "id": text_id or _random_id(),
+            "messageId": message_id or _stream_message_id(),
             "text": text
         })
     
     # ==================== Tool Calls ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_tool_input_start(
         tool_call_id: str,
         tool_name: str,
@@ -243,19 +322,20 @@ class DataStreamContext:
         Args:
             tool_call_id: Tool call ID
             tool_name: Tool name
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "tool-input-start",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "toolCallId": tool_call_id,
             "toolName": tool_name
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_tool_input_delta(
         tool_call_id: str,
         input_text_delta: str,
@@ -266,19 +346,20 @@ class DataStreamContext:
         Args:
             tool_call_id: Tool call ID
             input_text_delta: Input text delta
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "tool-input-delta",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "toolCallId": tool_call_id,
             "inputTextDelta": input_text_delta
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_tool_input_available(
         tool_call_id: str,
         tool_name: str,
@@ -291,20 +372,21 @@ class DataStreamContext:
             tool_call_id: Tool call ID
             tool_name: Tool name
             input_data: Input data
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "tool-input-available",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "toolCallId": tool_call_id,
             "toolName": tool_name,
             "input": input_data
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_tool_output_available(
         tool_call_id: str,
         output: Any,
@@ -315,19 +397,20 @@ class DataStreamContext:
         Args:
             tool_call_id: Tool call ID
             output: Output data
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "tool-output-available",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "toolCallId": tool_call_id,
             "output": output
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_tool_output_error(
         tool_call_id: str,
         error_text: str,
@@ -338,14 +421,14 @@ class DataStreamContext:
         Args:
             tool_call_id: Tool call ID
             error_text: Error text
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "tool-output-error",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "toolCallId": tool_call_id,
             "errorText": error_text
         })
@@ -353,6 +436,7 @@ class DataStreamContext:
     # ==================== Reasoning Process ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_reasoning(
         text: str,
         message_id: Optional[str] = None
@@ -361,18 +445,19 @@ class DataStreamContext:
         
         Args:
             text: Reasoning text
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "reasoning",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "text": text
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_reasoning_start(
         reasoning_id: Optional[str] = None,
         message_id: Optional[str] = None
@@ -381,18 +466,19 @@ class DataStreamContext:
         
         Args:
             reasoning_id: Reasoning ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "reasoning-start",
-            "id": reasoning_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4())
+            "id": reasoning_id or _random_id(),
+            "messageId": message_id or _stream_message_id()
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_reasoning_delta(
         delta: str,
         reasoning_id: Optional[str] = None,
@@ -403,19 +489,20 @@ class DataStreamContext:
         Args:
             delta: Reasoning delta content
             reasoning_id: Reasoning ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "reasoning-delta",
-            "id": reasoning_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4()),
+            "id": reasoning_id or _random_id(),
+            "messageId": message_id or _stream_message_id(),
             "delta": delta
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_reasoning_end(
         reasoning_id: Optional[str] = None,
         message_id: Optional[str] = None
@@ -424,20 +511,21 @@ class DataStreamContext:
         
         Args:
             reasoning_id: Reasoning ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "reasoning-end",
-            "id": reasoning_id or str(uuid.uuid4()),
-            "messageId": message_id or str(uuid.uuid4())
+            "id": reasoning_id or _random_id(),
+            "messageId": message_id or _stream_message_id()
         })
     
     # ==================== Error Handling ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_error(
         error_text: str,
         message_id: Optional[str] = None
@@ -446,18 +534,19 @@ class DataStreamContext:
         
         Args:
             error_text: Error text
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "error",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "errorText": error_text
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_abort(
         reason: Optional[str] = None,
         message_id: Optional[str] = None
@@ -466,14 +555,14 @@ class DataStreamContext:
         
         Args:
             reason: Abort reason
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         data = {
             "type": "abort",
-            "messageId": message_id or str(uuid.uuid4())
+            "messageId": message_id or _stream_message_id()
         }
         if reason:
             data["reason"] = reason
@@ -483,6 +572,7 @@ class DataStreamContext:
     # ==================== Metadata and Attachments ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_message_metadata(
         metadata: Dict[str, Any],
         message_id: Optional[str] = None
@@ -491,14 +581,14 @@ class DataStreamContext:
         
         Args:
             metadata: Metadata dictionary
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "message-metadata",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "metadata": metadata
         })
     
@@ -518,7 +608,7 @@ class DataStreamContext:
             media_type: Media type (v5 protocol)
             data: Base64 encoded file data (v4 protocol)
             mime_type: MIME type (v4 protocol)
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             protocol_version: Protocol version ("v4" or "v5"), auto-detected if not provided
             
         Returns:
@@ -549,7 +639,7 @@ class DataStreamContext:
             
             return await DataStreamContext.emit_data({
                 "type": "file",
-                "messageId": message_id or str(uuid.uuid4()),
+                "messageId": message_id or _stream_message_id(),
                 "data": data,
                 "mimeType": mime_type
             })
@@ -567,12 +657,13 @@ class DataStreamContext:
             
             return await DataStreamContext.emit_data({
                 "type": "file",
-                "messageId": message_id or str(uuid.uuid4()),
+                "messageId": message_id or _stream_message_id(),
                 "url": url,
                 "mediaType": media_type
             })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_source_url(
         url: str,
         description: Optional[str] = None,
@@ -583,14 +674,14 @@ class DataStreamContext:
         Args:
             url: Source URL
             description: Description
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         data = {
             "type": "source-url",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "url": url
         }
         if description:
@@ -601,6 +692,7 @@ class DataStreamContext:
     # ==================== Step Control ====================
     
     @staticmethod
+    @_skip_without_stream
     async def emit_start_step(
         step_type: str,
         step_id: Optional[str] = None,
@@ -611,19 +703,20 @@ class DataStreamContext:
         Args:
             step_type: Step type
             step_id: Step ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "start-step",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "stepType": step_type,
-            "stepId": step_id or str(uuid.uuid4())
+            "stepId": step_id or _random_id()
         })
     
     @staticmethod
+    @_skip_without_stream
     async def emit_finish_step(
         step_type: str,
         step_id: Optional[str] = None,
@@ -634,14 +727,14 @@ class DataStreamContext:
         Args:
             step_type: Step type
             step_id: Step ID, auto-generated if not provided
-            message_id: Message ID, auto-generated if not provided
+            message_id: Message ID, defaults to the current stream's message ID
             
         Returns:
             bool: True if sent successfully, False otherwise
         """
         return await DataStreamContext.emit_data({
             "type": "finish-step",
-            "messageId": message_id or str(uuid.uuid4()),
+            "messageId": message_id or _stream_message_id(),
             "stepType": step_type,
-            "stepId": step_id or str(uuid.uuid4())
+            "stepId": step_id or _random_id()
         })
\ No newline at end of file
@@ -3,8 +3,9 @@
 import asyncio
 import json
 import logging
-import uuid
-from typing import AsyncGenerator, Dict, Any, Optional, List
+from collections import deque
+from contextlib import suppress
+from typing import AsyncGenerator, AsyncIterable, Callable, Deque, Dict, Any, Iterable, Optional, List, Union
 
 try:
     from fastapi.responses import StreamingResponse
@@ -12,7 +13,7 @@ except ImportError:
     # Fallback for when FastAPI is not available
     StreamingResponse = None
 
-from .protocol_strategy import ProtocolConfig
+from .protocol_strategy import ProtocolConfig, ProtocolStrategy
 from .text_processing_adapter import TextProcessingAdapter
 
 from .models import (
@@ -44,7 +45,48 @@ from .models import (
 from .message_builder import MessageBuilder
 from .protocol_generator import ProtocolGenerator
 from .callbacks import BaseAICallbackHandler
-from .context import DataStreamContext
+from .context import DataStreamContext, _random_id
+
+
+def _termination_marker(strategy: ProtocolStrategy, processor: Optional[Any]) -> Optional[str]:
+    """Return the protocol termination marker for a processed stream.
+    
+    Returns None when the processor emits finish events itself (auto_events),
+    so the marker is not sent twice.
+    """
+    if processor is not None and getattr(processor, "auto_events", False):
+        return None
+    usage_info = getattr(processor, "current_usage", None)
+    return strategy.get_termination_marker(usage_info)
+
+
+async def _format_protocol_stream(
+    chunks: AsyncIterable[UIMessageChunk],
+    strategy: ProtocolStrategy,
+    processor: Optional[Any] = None,
+    terminate: bool = True
+) -> AsyncGenerator[str, None]:
+    """Format processed chunks as protocol text.
+    
+    Chunks the strategy formats to nothing are skipped.
+    
+    Args:
+        chunks: Processed UI message chunks
+        strategy: Protocol strategy formatting the chunks
+        processor: StreamProcessor that produced the chunks, for usage and
+            auto_events
+        terminate: Whether to end with the termination marker; callers that
+            merge in more chunks send it themselves
+    """
+    format_chunk = strategy.format_chunk
+    async for chunk in chunks:
+        formatted_text = format_chunk(chunk)
+        if formatted_text:
+            yield formatted_text
+    if terminate:
+        marker = _termination_marker(strategy, processor)
+        if marker:
+            yield marker
 
 
 class DataStreamWithEmitters:
@@ -63,13 +105,31 @@ class DataStreamWithEmitters:
         callbacks: Optional[BaseAICallbackHandler] = None,
         protocol_version: str = "v4",
         output_format: str = "chunks",  # "chunks" or "protocol"
-        stream_processor: Optional[Any] = None  # StreamProcessor instance for usage tracking
+        stream_processor: Optional[Any] = None,  # StreamProcessor instance for usage tracking
+        max_buffered_chunks: int = 0,  # Unread chunks before emits wait, 0 for no limit
+        text_delta_coalesce_ms: int = 0  # Window for joining emit_text_delta calls, 0 to not join
     ):
         self._stream_generator = stream_generator
         self._message_id = message_id
-        self._manual_queue: asyncio.Queue = asyncio.Queue()
+        # Manual emits are appended here and _manual_ready wakes the reader;
+        # unlike asyncio.Queue this needs no future per chunk
+        self._manual_chunks: Deque[Optional[Dict[str, Any]]] = deque()
+        self._manual_ready = asyncio.Event()
+        # With max_buffered_chunks set, manual emits wait on _manual_space while
+        # that many chunks are unread, so a slow reader holds back producers
+        self._max_buffered_chunks = max_buffered_chunks
+        self._manual_space = asyncio.Event()
+        # With text_delta_coalesce_ms set, emit_text_delta buffers deltas for one
+        # text ID and a timer emits them as a single chunk; _pending_text_id is
+        # only meaningful while _pending_deltas is non-empty
+        self._text_delta_coalesce_ms = text_delta_coalesce_ms
+        self._pending_text_id = ""
+        self._pending_deltas: List[str] = []
+        self._text_flush_handle: Optional[asyncio.TimerHandle] = None
         self._closed = False
         self._stream_started = False
+        # Producer tasks of the running __aiter__, stopped by aclose()
+        self._producer_tasks: List[asyncio.Task] = []
         self._auto_close = auto_close
         self._message_builder = message_builder
         self._callbacks = callbacks
@@ -82,10 +142,11 @@ class DataStreamWithEmitters:
         
         # Initialize protocol components if protocol output is enabled
         if self._output_format == "protocol":
-            from .protocol_strategy import ProtocolConfig
-            from .text_processing_adapter import TextProcessingAdapter
             self._protocol_config = ProtocolConfig(protocol_version)
             self._text_adapter = TextProcessingAdapter(protocol_version)
+            # The strategy is fixed per stream, so bind its formatter once
+            # instead of resolving the version-specific method per chunk
+            self._format_chunk = self._protocol_config.strategy.format_chunk
     
     async def emit_file(
         self, 
@@ -123,7 +184,7 @@ class DataStreamWithEmitters:
         """Emit a source-url chunk."""
         chunk = UIMessageChunkSourceUrl(
             type="source-url",
-            sourceId=str(uuid.uuid4()),
+            sourceId=_random_id(),
             url=url,
             title=title
         )
@@ -179,7 +240,7 @@ class DataStreamWithEmitters:
     ) -> None:
         """Emit a text-start chunk using unified protocol generator."""
         chunk = ProtocolGenerator.create_text_start(
-            text_id or str(uuid.uuid4()),
+            text_id or _random_id(),
             self._protocol_version
         )
         await self._emit_manual_chunk(chunk)
@@ -190,9 +251,29 @@ class DataStreamWithEmitters:
         text_id: Optional[str] = None,
         message_id: Optional[str] = None
     ) -> None:
-        """Emit a text-delta chunk using unified protocol generator."""
+        """Emit a text-delta chunk using unified protocol generator.
+        
+        With text_delta_coalesce_ms set, deltas for the same text ID are held
+        for up to that long and emitted as one chunk. A delta without a text ID
+        joins the deltas already held.
+        """
+        if self._text_delta_coalesce_ms:
+            if self._closed:
+                raise RuntimeError("Cannot emit to closed stream")
+            if not text_id:
+                text_id = self._pending_text_id if self._pending_deltas else _random_id()
+            elif self._pending_deltas and text_id != self._pending_text_id:
+                await self._drain_text_deltas()
+            self._pending_text_id = text_id
+            self._pending_deltas.append(delta)
+            if self._text_flush_handle is None:
+                self._text_flush_handle = asyncio.get_running_loop().call_later(
+                    self._text_delta_coalesce_ms / 1000.0, self._flush_text_deltas
+                )
+            return
+        
         chunk = ProtocolGenerator.create_text_delta(
-            text_id or str(uuid.uuid4()),
+            text_id or _random_id(),
             delta,
             self._protocol_version
         )
@@ -206,7 +287,7 @@ class DataStreamWithEmitters:
     ) -> None:
         """Emit a text-end chunk using unified protocol generator."""
         chunk = ProtocolGenerator.create_text_end(
-            text_id or str(uuid.uuid4()),
+            text_id or _random_id(),
             text,
             self._protocol_version
         )
@@ -391,68 +472,157 @@ class DataStreamWithEmitters:
         """
         # Convert raw data to a generic chunk format
         # This is used by DataStreamContext for direct data emission
-        await self._manual_queue.put(data)
+        if self._pending_deltas:
+            await self._drain_text_deltas()
+        if self._max_buffered_chunks:
+            await self._wait_for_manual_space()
+        self._push_manual(data)
     
     async def _emit_manual_chunk(self, chunk: UIMessageChunk) -> None:
         """Emit a manual chunk to the queue."""
         if self._closed:
             raise RuntimeError("Cannot emit to closed stream")
         
+        # Buffered text deltas were emitted first, so they go out first
+        if self._pending_deltas:
+            await self._drain_text_deltas()
+        
         # Mark chunk as manual for processing in __aiter__
         chunk_with_meta = dict(chunk)
         chunk_with_meta['_is_manual'] = True
         
-        await self._manual_queue.put(chunk_with_meta)
+        if self._max_buffered_chunks:
+            await self._wait_for_manual_space()
+        self._push_manual(chunk_with_meta)
+    
+    async def _wait_for_manual_space(self) -> None:
+        """Wait while max_buffered_chunks manual chunks are unread."""
+        manual_chunks = self._manual_chunks
+        while len(manual_chunks) >= self._max_buffered_chunks and not self._closed:
+            self._manual_space.clear()
+            await self._manual_space.wait()
+    
+    def _take_text_deltas(self) -> Optional[Dict[str, Any]]:
+        """Stop the flush timer and join the buffered text deltas into one chunk."""
+        if self._text_flush_handle is not None:
+            self._text_flush_handle.cancel()
+            self._text_flush_handle = None
+        if not self._pending_deltas:
+            return None
+        
+        chunk = dict(ProtocolGenerator.create_text_delta(
+            self._pending_text_id,
+            "".join(self._pending_deltas),
+            self._protocol_version
+        ))
+        chunk['_is_manual'] = True
+        self._pending_deltas = []
+        return chunk
+    
+    async def _drain_text_deltas(self) -> None:
+        """Emit the buffered text deltas, waiting for buffer space like other emits."""
+        chunk = self._take_text_deltas()
+        if chunk is None:
+            return
+        if self._max_buffered_chunks:
+            await self._wait_for_manual_space()
+        self._push_manual(chunk)
+    
+    def _flush_text_deltas(self) -> None:
+        """Emit the buffered text deltas from the coalescing timer or on close.
+        
+        These callers cannot wait, so the chunk is queued even when
+        max_buffered_chunks are unread; that is at most one chunk per window.
+        """
+        chunk = self._take_text_deltas()
+        if chunk is not None:
+            self._push_manual(chunk)
+    
+    def _push_manual(self, chunk: Optional[Dict[str, Any]]) -> None:
+        """Queue a manual chunk, or None to end manual emission, for __aiter__."""
+        self._manual_chunks.append(chunk)
+        self._manual_ready.set()
     
     async def __aiter__(self):
         """Async iterator that merges automatic and manual chunks."""
         # Use a queue to merge both streams
-        merged_queue: asyncio.Queue = asyncio.Queue()
+        merged_queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_buffered_chunks)
+        protocol_output = self._output_format == "protocol"
         
         async def auto_producer():
             try:
-                async for chunk in self._stream_generator:
-                    await merged_queue.put(("auto", chunk))
-            except GeneratorExit:
-                # Generator is being closed, log for debugging and re-raise to ensure proper cleanup
-                logging.debug(f"DataStreamWithEmitters.auto_producer: Generator exit for stream {id(self)}")
+                if protocol_output:
+                    # Format automatic chunks as they are produced so the merge
+                    # loop only forwards text for them; the termination marker
+                    # follows the manual chunks
+                    async for formatted_text in _format_protocol_stream(
+                        self._stream_generator,
+                        self._protocol_config.strategy,
+                        terminate=False
+                    ):
+                        await merged_queue.put(("formatted", formatted_text))
+                else:
+                    async for chunk in self._stream_generator:
+                        await merged_queue.put(("auto", chunk))
+            except asyncio.CancelledError:
+                # Stopped by aclose(); wake the merge loop without waiting for space
+                with suppress(asyncio.QueueFull):
+                    merged_queue.put_nowait(("auto_end", None))
                 raise
             except Exception as e:
                 await merged_queue.put(("error", e))
-            finally:
-                await merged_queue.put(("auto_end", None))
+            await merged_queue.put(("auto_end", None))
         
         async def manual_producer():
+            manual_chunks = self._manual_chunks
+            manual_ready = self._manual_ready
+            manual_space = self._manual_space
+            bounded = self._max_buffered_chunks > 0
             try:
                 while not self._closed:
-                    try:
-                        chunk = await asyncio.wait_for(self._manual_queue.get(), timeout=0.1)
-                        if chunk is None:
-                            break
-                        await merged_queue.put(("manual", chunk))
-                    except asyncio.TimeoutError:
-                        # If auto stream has ended and auto_close is True, end manual stream too
-                        if auto_task.done() and self._auto_close:
-                            break
-                        continue
+                    if not manual_chunks:
+                        # Only wait when nothing is queued; a burst of emits is
+                        # forwarded without a timed wait per chunk
+                        manual_ready.clear()
+                        try:
+                            await asyncio.wait_for(manual_ready.wait(), timeout=0.1)
+                        except asyncio.TimeoutError:
+                            # If auto stream has ended and auto_close is True, end manual stream too
+                            if auto_task.done() and self._auto_close:
+                                break
+                            continue
+                    chunk = manual_chunks.popleft()
+                    if bounded:
+                        # Wake emitters waiting for buffer space
+                        manual_space.set()
+                    if chunk is None:
+                        break
+                    await merged_queue.put(("manual", chunk))
+            except asyncio.CancelledError:
+                with suppress(asyncio.QueueFull):
+                    merged_queue.put_nowait(("manual_end", None))
+                raise
             except Exception as e:
                 await merged_queue.put(("error", e))
-            finally:
-                await merged_queue.put(("manual_end", None))
+            await merged_queue.put(("manual_end", None))
         
         # Start both producers
         auto_task = asyncio.create_task(auto_producer())
         manual_task = asyncio.create_task(manual_producer())
+        self._producer_tasks = [auto_task, manual_task]
         
         auto_ended = False
         manual_ended = False
+        closed_early = False
         
         try:
             while not (auto_ended and manual_ended):
                 try:
                     source, chunk = await asyncio.wait_for(merged_queue.get(), timeout=1.0)
                     
-                    if source == "auto_end":
+                    if source == "formatted":
+                        yield chunk
+                    elif source == "auto_end":
                         auto_ended = True
                         continue
                     elif source == "manual_end":
@@ -482,7 +652,7 @@ class DataStreamWithEmitters:
                             final_chunk = clean_chunk
                         
                         # Output chunk based on format preference
-                        if self._output_format == "protocol":
+                        if protocol_output:
                             # Format chunk for protocol output
                             formatted_text = self._format_chunk_for_protocol(final_chunk)
                             if formatted_text:
@@ -497,12 +667,13 @@ class DataStreamWithEmitters:
                         break
                     continue
         except GeneratorExit:
-            # Generator is being closed, log for debugging and re-raise to ensure proper cleanup
-            logging.debug(f"DataStreamWithEmitters.__aiter__: Generator exit for stream {id(self)}")
+            # The consumer stopped iterating; nothing more can be yielded
+            closed_early = True
+            await self.aclose()
             raise
         finally:
             # Send termination marker for protocol output
-            if self._output_format == "protocol":
+            if self._output_format == "protocol" and not closed_early:
                 termination_text = self._send_termination_marker()
                 if termination_text:
                     yield termination_text
@@ -532,12 +703,12 @@ class DataStreamWithEmitters:
             chunk_type not in ["text-delta", "text-start", "text-end"]):
             # Finish current text sequence before processing non-text chunk
             for finish_chunk in self._text_adapter.finish_text_sequence():
-                formatted_chunk = self._protocol_config.strategy.format_chunk(finish_chunk)
+                formatted_chunk = self._format_chunk(finish_chunk)
                 if formatted_chunk:
                     return formatted_chunk
         
         # Format the chunk using protocol strategy
-        return self._protocol_config.strategy.format_chunk(chunk)
+        return self._format_chunk(chunk)
     
     def _send_termination_marker(self) -> Optional[str]:
         """Send protocol-specific termination marker."""
@@ -547,24 +718,13 @@ class DataStreamWithEmitters:
         # Finish any remaining text sequence
         if self._text_adapter.is_text_active():
             for finish_chunk in self._text_adapter.finish_text_sequence():
-                formatted_chunk = self._protocol_config.strategy.format_chunk(finish_chunk)
+                formatted_chunk = self._format_chunk(finish_chunk)
                 if formatted_chunk:
                     return formatted_chunk
         
-        # If stream_processor has auto_events enabled, it will handle finish events
-        # so we don't need to send termination marker to avoid duplicate 'd:' events
-        if (self._stream_processor and 
-            hasattr(self._stream_processor, 'auto_events') and 
-            self._stream_processor.auto_events):
-            return None
-        
-        # Get usage info from stream processor if available
-        usage_info = None
-        if self._stream_processor and hasattr(self._stream_processor, 'current_usage'):
-            usage_info = self._stream_processor.current_usage
-        
-        # Send protocol-specific termination marker with usage info
-        return self._protocol_config.strategy.get_termination_marker(usage_info)
+        # A processor with auto_events emits its own finish events, so the
+        # marker is skipped to avoid duplicate 'd:' events
+        return _termination_marker(self._protocol_config.strategy, self._stream_processor)
     
     def _get_termination_text(self) -> str:
         """Get termination text for protocol output."""
@@ -590,6 +750,8 @@ class DataStreamWithEmitters:
     async def close(self):
         """Close the stream."""
         self._closed = True
+        # Release emitters waiting for buffer space
+        self._manual_space.set()
         
         # Call on_finish callback if available
         if self._callbacks and isinstance(self._callbacks, BaseAICallbackHandler):
@@ -602,10 +764,164 @@ class DataStreamWithEmitters:
                 # Don't re-raise to avoid breaking the stream
                 pass
         
-        await self._manual_queue.put(None)
+        self._flush_text_deltas()
+        self._push_manual(None)
     
+    async def aclose(self) -> None:
+        """Close the underlying LangChain stream early.
+
+        Called by the iterator when its consumer stops early, and safe to call
+        directly while iterating: the producer tasks are stopped before the
+        LangChain stream is closed, so it is never closed while running.
+        """
+        logging.debug(f"DataStreamWithEmitters.aclose: Closing stream for message {self._message_id}")
+        self._closed = True
+        self._manual_space.set()
+        producers = [task for task in self._producer_tasks if not task.done()]
+        for task in producers:
+            task.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+        aclose = getattr(self._stream_generator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        self._flush_text_deltas()
+        self._push_manual(None)
+    
+
 
 
+# Maximum number of chunks a reader task buffers ahead of its consumer
+_READ_AHEAD_MAXSIZE = 64
+
+# Marks the end of the stream feeding _iter_ready_batches
+_BATCH_END = object()
+
+
+async def _iter_ready_batches(
+    chunks: AsyncIterable[Any],
+    limit: int = 0,
+    flush_ms: int = 0,
+    weight: Optional[Callable[[Any], int]] = None
+) -> AsyncGenerator[List[Any], None]:
+    """Read chunks ahead in a task and yield those that are ready as batches.
+    
+    A reader task fills a bounded queue, so a slow consumer holds back the
+    source only once the queue is full, while each batch takes every chunk
+    already queued. With flush_ms at 0 no chunk is held back waiting for more
+    to arrive, so batching adds no latency.
+    
+    Args:
+        chunks: Stream of chunks to batch
+        limit: Batch size at which a batch is yielded right away, 0 for no
+            limit
+        flush_ms: How long to keep a batch open for more chunks, 0 to only
+            take those already queued
+        weight: Size of a chunk towards limit, 1 per chunk by default
+    
+    Yields:
+        List[Any]: One or more chunks, in stream order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_READ_AHEAD_MAXSIZE)
+    loop = asyncio.get_running_loop()
+    flush_after = flush_ms / 1000.0
+    
+    async def read_chunks() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception:
+            await queue.put(_BATCH_END)
+            raise
+        await queue.put(_BATCH_END)
+    
+    reader = asyncio.create_task(read_chunks())
+    try:
+        done = False
+        while not done:
+            chunk = await queue.get()
+            if chunk is _BATCH_END:
+                break
+            batch = [chunk]
+            size = weight(chunk) if weight else 1
+            deadline = loop.time() + flush_after if flush_after else 0.0
+            while not limit or size < limit:
+                if not queue.empty():
+                    chunk = queue.get_nowait()
+                elif not flush_after:
+                    break
+                else:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        chunk = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if chunk is _BATCH_END:
+                    done = True
+                    break
+                batch.append(chunk)
+                size += weight(chunk) if weight else 1
+            yield batch
+        # Re-raise any error from the source stream
+        await reader
+    finally:
+        if not reader.done():
+            reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await reader
+
+
+async def _read_ahead(
+    chunks: AsyncIterable[Union[str, bytes]]
+) -> AsyncGenerator[Union[str, bytes], None]:
+    """Yield chunks one by one while a task reads ahead of the consumer.
+    
+    Upstream reads then overlap with sending each chunk instead of waiting
+    for it, up to the read-ahead queue size.
+    """
+    batches = _iter_ready_batches(chunks)
+    try:
+        async for batch in batches:
+            for chunk in batch:
+                yield chunk
+    finally:
+        # Stop the reader task when the consumer leaves early
+        await batches.aclose()
+
+
+async def _coalesce_chunks(
+    chunks: AsyncIterable[Union[str, bytes]],
+    batch_bytes: int,
+    flush_ms: int = 0
+) -> AsyncGenerator[bytes, None]:
+    """Join protocol chunks into larger buffers so each send carries more data.
+    
+    Every chunk that is ready, up to batch_bytes, is joined into one UTF-8
+    buffer. With flush_ms at 0 a buffer is sent as soon as no more chunks
+    are queued, so no chunk is held back waiting for more to arrive.
+    
+    Args:
+        chunks: Protocol text or bytes to send
+        batch_bytes: Buffer size at which a buffer is sent right away
+        flush_ms: How long to keep a buffer open for more chunks, 0 to only
+            take those already queued
+    
+    Yields:
+        bytes: Joined protocol output
+    """
+    encoded = (
+        chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+        async for chunk in chunks
+    )
+    batches = _iter_ready_batches(encoded, batch_bytes, flush_ms, len)
+    try:
+        async for batch in batches:
+            yield b"".join(batch)
+    finally:
+        # Stop the reader task when the consumer leaves early
+        await batches.aclose()
+
 
 class DataStreamResponse(StreamingResponse):
     """FastAPI StreamingResponse wrapper for AI SDK Data Stream Protocol.
@@ -616,24 +932,37 @@ class DataStreamResponse(StreamingResponse):
     
     def __init__(
         self,
-        stream: AsyncGenerator[UIMessageChunk, None],
+        stream: AsyncIterable[Union[UIMessageChunk, str, bytes]],
         protocol_version: str = "v4",  # Default to v4
         headers: Optional[Dict[str, str]] = None,
-        status: int = 200
+        status: int = 200,
+        batch_bytes: int = 0,
+        flush_ms: int = 0
     ):
         """Initialize DataStreamResponse.
         
         Args:
-            stream: The data stream generator
+            stream: The data stream, any async iterable of chunks or
+                already-formatted protocol text
             protocol_version: Protocol version ("v4" or "v5")
             headers: Optional HTTP headers
             status: HTTP status code
+            batch_bytes: Join ready protocol chunks into buffers of up to
+                about this many bytes before sending, 0 to send each chunk
+                on its own
+            flush_ms: How long to keep a buffer open for more chunks when
+                batch_bytes is set, 0 to only join chunks already available
         """
         # Create protocol configuration
         self.protocol_config = ProtocolConfig(protocol_version)
         
         # Convert UIMessageChunk stream to protocol-specific text stream
         text_stream = self._convert_to_protocol_stream(stream)
+        if batch_bytes > 0:
+            text_stream = _coalesce_chunks(text_stream, batch_bytes, flush_ms)
+        else:
+            # Keep reading the stream while a slow client drains the response
+            text_stream = _read_ahead(text_stream)
         
         # Get protocol-specific headers
         protocol_headers = self.protocol_config.strategy.get_headers()
@@ -648,12 +977,19 @@ class DataStreamResponse(StreamingResponse):
     
     async def _convert_to_protocol_stream(
         self, 
-        data_stream: AsyncGenerator[UIMessageChunk, None]
-    ) -> AsyncGenerator[str, None]:
+        data_stream: AsyncIterable[Union[UIMessageChunk, str, bytes]]
+    ) -> AsyncGenerator[Union[str, bytes], None]:
         """Convert UIMessageChunk stream to protocol-specific format."""
         text_adapter = TextProcessingAdapter(self.protocol_config.version)
+        format_chunk = self.protocol_config.strategy.format_chunk
         
         async for chunk in data_stream:
+            # Already-formatted protocol text (e.g. from to_data_stream) or
+            # pre-encoded bytes is forwarded untouched
+            if isinstance(chunk, (str, bytes)):
+                yield chunk
+                continue
+            
             # Handle text sequence management for different protocols
             chunk_type = chunk.get("type") if isinstance(chunk, dict) else getattr(chunk, "type", None)
             
@@ -662,19 +998,19 @@ class DataStreamResponse(StreamingResponse):
                 chunk_type not in ["text-delta", "text-start", "text-end"]):
                 # Finish current text sequence before processing non-text chunk
                 for finish_chunk in text_adapter.finish_text_sequence():
-                    formatted_chunk = self.protocol_config.strategy.format_chunk(finish_chunk)
+                    formatted_chunk = format_chunk(finish_chunk)
                     if formatted_chunk:
                         yield formatted_chunk
             
             # Format the chunk using protocol strategy
-            formatted_chunk = self.protocol_config.strategy.format_chunk(chunk)
+            formatted_chunk = format_chunk(chunk)
             if formatted_chunk:
                 yield formatted_chunk
         
         # Finish any remaining text sequence
         if text_adapter.is_text_active():
             for finish_chunk in text_adapter.finish_text_sequence():
-                formatted_chunk = self.protocol_config.strategy.format_chunk(finish_chunk)
+                formatted_chunk = format_chunk(finish_chunk)
                 if formatted_chunk:
                     yield formatted_chunk
         
@@ -698,7 +1034,8 @@ class DataStreamWriter:
     
     def __init__(self):
         """Initialize DataStreamWriter."""
-        self._chunks: List[UIMessageChunk] = []
+        # Write history for get_chunks(); readers consume through the queue
+        self._chunks: Deque[UIMessageChunk] = deque()
         self._closed = False
         self._queue: asyncio.Queue = asyncio.Queue()
     
@@ -713,6 +1050,22 @@ class DataStreamWriter:
         self._chunks.append(chunk)
         await self._queue.put(chunk)
     
+    async def write_many(self, chunks: Iterable[UIMessageChunk]) -> None:
+        """Write several chunks to the data stream in order.
+        
+        Args:
+            chunks: UI message chunks to write
+        """
+        if self._closed:
+            raise RuntimeError("Cannot write to closed stream")
+        if not isinstance(chunks, (list, tuple)):
+            chunks = list(chunks)
+        self._chunks.extend(chunks)
+        # The queue is unbounded, so this never has to wait
+        put = self._queue.put_nowait
+        for chunk in chunks:
+            put(chunk)
+    
     async def close(self) -> None:
         """Close the data stream writer."""
         self._closed = True
@@ -721,10 +1074,13 @@ class DataStreamWriter:
     def get_chunks(self) -> List[UIMessageChunk]:
         """Get all written chunks.
         
+        This builds a new list on every call; iterate the writer to consume
+        chunks as they are written.
+        
         Returns:
             List of UI message chunks
         """
-        return self._chunks.copy()
+        return list(self._chunks)
     
     async def __aiter__(self):
         """Async iterator for the stream."""
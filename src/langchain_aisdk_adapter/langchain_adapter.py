@@ -1,29 +1,27 @@
 """LangChain to AI SDK adapter providing core conversion methods."""
 
 import asyncio
-import logging
-import uuid
-import re
-from typing import AsyncIterable, AsyncGenerator, Optional, Dict, Any, Literal, TypedDict, Callable, Awaitable, Union, List
+import itertools
+import os
+from contextvars import Token
+from dataclasses import dataclass
+from functools import lru_cache
+from os import urandom
+from types import MappingProxyType
+from typing import AsyncIterable, Optional, Dict, Any, FrozenSet, List, Literal, Mapping, Tuple, TypedDict, Callable, cast
 
 from .models import LangChainStreamInput, UIMessageChunk
 from .stream_processor import StreamProcessor
-from .data_stream import DataStreamWithEmitters, DataStreamResponse, DataStreamWriter
+from .data_stream import (
+    DataStreamWithEmitters,
+    DataStreamResponse,
+    DataStreamWriter,
+    _format_protocol_stream,
+    _iter_ready_batches,
+)
+from .protocol_strategy import ProtocolConfig
 from .callbacks import BaseAICallbackHandler
 from .context import DataStreamContext
-from .lifecycle import ContextLifecycleManager
-
-try:
-    from langchain_core.language_models import BaseLanguageModel
-    from langchain_core.messages import BaseMessage
-    from langchain_core.tools import BaseTool
-    from langchain_core.runnables import Runnable
-except ImportError:
-    # Fallback for when LangChain is not available
-    BaseLanguageModel = None
-    BaseMessage = None
-    BaseTool = None
-    Runnable = None
 
 try:
     from fastapi.responses import StreamingResponse
@@ -32,6 +30,88 @@ except ImportError:
     StreamingResponse = None
 
 
+def _fast_message_id() -> str:
+    """Generate a random UUID4 string straight from os.urandom.
+    
+    Produces the same canonical form as str(uuid.uuid4()) without building
+    and validating a UUID object on every request.
+    """
+    h = urandom(16).hex()
+    # Set the version (4) and RFC 4122 variant bits
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+# Process-local message ID state for the fast_message_id option. The prefix is
+# random rather than the PID: containerized workers commonly all run as PID 1
+_cheap_id_prefix = urandom(6).hex()
+_cheap_id_next = itertools.count().__next__
+
+
+def _reset_cheap_message_ids() -> None:
+    """Restart cheap message IDs with a fresh prefix after a fork."""
+    global _cheap_id_prefix, _cheap_id_next
+    _cheap_id_prefix = urandom(6).hex()
+    _cheap_id_next = itertools.count().__next__
+
+
+if hasattr(os, "register_at_fork"):
+    # Pre-fork servers import once and fork workers; keep their IDs distinct
+    os.register_at_fork(after_in_child=_reset_cheap_message_ids)
+
+
+def _cheap_message_id() -> str:
+    """Generate a message ID from the process prefix and a counter (not a UUID)."""
+    return f"{_cheap_id_prefix}-{_cheap_id_next():x}"
+
+
+def _default_message_id(opts: "_ParsedOptions") -> str:
+    """Generate a message ID according to the fast_message_id option."""
+    return _cheap_message_id() if opts.fast_message_id else _fast_message_id()
+
+
+def _resolve_message_id(message_id: Optional[str], opts: "_ParsedOptions") -> str:
+    """Return the caller's message ID, or generate one.
+
+    A custom experimental_generateMessageId wins over the built-in
+    generators, and neither is called when message_id is already set.
+    """
+    if message_id:
+        return message_id
+    generate = opts.experimental_generateMessageId
+    return generate() if generate is not None else _default_message_id(opts)
+
+
+async def _write_batched(
+    chunks: AsyncIterable[Any],
+    writer: DataStreamWriter,
+    batch_size: int = 0,
+    flush_ms: int = 0
+) -> None:
+    """Forward chunks to a writer, coalescing those already available.
+    
+    Every batch of ready chunks is handed over in a single write_many()
+    call. By default chunks are never held back waiting for more to
+    arrive, so batching adds no latency.
+    
+    Args:
+        chunks: Stream of chunks to forward
+        writer: Writer receiving the chunks
+        batch_size: Maximum chunks per write, 0 for no limit
+        flush_ms: How long to keep a batch open for more chunks, 0 to only
+            take those already queued
+    """
+    batches = _iter_ready_batches(chunks, batch_size, flush_ms)
+    try:
+        async for batch in batches:
+            if len(batch) == 1:
+                await writer.write(batch[0])
+            else:
+                await writer.write_many(batch)
+    finally:
+        # Stop the reader task if writing fails or is cancelled
+        await batches.aclose()
+
+
 class AdapterOptions(TypedDict, total=False):
     """Options for controlling adapter behavior.
     
@@ -44,6 +124,21 @@ class AdapterOptions(TypedDict, total=False):
         auto_context: Whether to automatically set up context, defaults to True
         experimental_transform: Stream transformer function for smoothing output
         experimental_generateMessageId: Function to generate custom message IDs
+        fast_message_id: Generate default message IDs from a random per-process
+            prefix and a counter instead of UUID4, defaults to False
+        merge_batch_size: Maximum chunks merge_into_data_stream hands to the
+            writer at once, defaults to 0 (no limit)
+        merge_flush_ms: How long merge_into_data_stream waits for more chunks
+            before writing a batch, defaults to 0 (write what is ready)
+        response_batch_bytes: Join ready chunks of to_data_stream_response
+            output into buffers of up to about this many bytes, defaults to 0
+            (send each chunk on its own)
+        response_flush_ms: How long to_data_stream_response keeps a buffer
+            open for more chunks, defaults to 0 (send what is ready)
+        max_buffered_chunks: Unread chunks to_data_stream buffers before
+            manual emits wait for the reader, defaults to 0 (no limit)
+        text_delta_coalesce_ms: How long emit_text_delta on the stream from
+            to_data_stream holds deltas to join them, defaults to 0 (off)
     """
     protocol_version: Literal['v4', 'v5']
     auto_events: bool
@@ -53,6 +148,138 @@ class AdapterOptions(TypedDict, total=False):
     auto_context: bool
     experimental_transform: Callable[[AsyncIterable[Any]], AsyncIterable[Any]]
     experimental_generateMessageId: Callable[[], str]
+    fast_message_id: bool
+    merge_batch_size: int
+    merge_flush_ms: int
+    response_batch_bytes: int
+    response_flush_ms: int
+    max_buffered_chunks: int
+    text_delta_coalesce_ms: int
+
+
+class _ContextIter:
+    """Async iterator stepping chunks with data_stream as the current context stream.
+    
+    Does what iterating inside ContextLifecycleManager.managed_context does,
+    but without resuming a generator frame for every chunk: the stream is set
+    on the first step and the previous one restored once the source is
+    exhausted, fails or is closed.
+    """
+    
+    __slots__ = ("_it", "_data_stream", "_token", "_done")
+    
+    def __init__(self, chunks: AsyncIterable[UIMessageChunk], data_stream: DataStreamWithEmitters):
+        self._it = chunks.__aiter__()
+        self._data_stream = data_stream
+        self._token: Optional[Token] = None
+        self._done = False
+    
+    def __aiter__(self) -> "_ContextIter":
+        return self
+    
+    async def __anext__(self) -> UIMessageChunk:
+        if self._token is None:
+            if self._done:
+                raise StopAsyncIteration
+            self._token = DataStreamContext.set_current_stream(self._data_stream)
+        try:
+            return await self._it.__anext__()
+        except BaseException:
+            self._restore_context()
+            raise
+    
+    def _restore_context(self) -> None:
+        """Restore the context stream that was current before the first step."""
+        self._done = True
+        if self._token is not None:
+            DataStreamContext.clear_current_stream(self._token)
+            self._token = None
+    
+    async def aclose(self) -> None:
+        """Restore the context and close the underlying stream."""
+        self._restore_context()
+        aclose = getattr(self._it, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+# Adapter streams always produce protocol-formatted output
+_OUTPUT_FORMAT = "protocol"
+
+# Defaults for every AdapterOptions key, read-only so they can be shared
+_DEFAULT_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    "protocol_version": "v4",
+    "auto_events": True,
+    "auto_close": True,
+    "emit_start": True,
+    "emit_finish": True,
+    "auto_context": True,
+    "experimental_transform": None,
+    "experimental_generateMessageId": None,
+    "fast_message_id": False,
+    "merge_batch_size": 0,
+    "merge_flush_ms": 0,
+    "response_batch_bytes": 0,
+    "response_flush_ms": 0,
+    "max_buffered_chunks": 0,
+    "text_delta_coalesce_ms": 0,
+})
+
+
+@dataclass(frozen=True)
+class _ParsedOptions:
+    """AdapterOptions resolved against their defaults.
+    
+    Internals read options as slot attributes instead of dict lookups.
+    """
+    __slots__ = tuple(_DEFAULT_OPTIONS)
+    
+    protocol_version: str
+    auto_events: bool
+    auto_close: bool
+    emit_start: bool
+    emit_finish: bool
+    auto_context: bool
+    experimental_transform: Optional[Callable[[AsyncIterable[Any]], AsyncIterable[Any]]]
+    experimental_generateMessageId: Optional[Callable[[], str]]
+    fast_message_id: bool
+    merge_batch_size: int
+    merge_flush_ms: int
+    response_batch_bytes: int
+    response_flush_ms: int
+    max_buffered_chunks: int
+    text_delta_coalesce_ms: int
+
+
+def _build_options(options: AdapterOptions) -> _ParsedOptions:
+    """Merge options over the defaults into a _ParsedOptions."""
+    merged: Dict[str, Any] = {**_DEFAULT_OPTIONS, **options}
+    # Keys that are not AdapterOptions are ignored
+    return _ParsedOptions(**{name: merged[name] for name in _DEFAULT_OPTIONS})
+
+
+# Calls without options share one parsed instance
+_DEFAULT_PARSED_OPTIONS = _build_options({})
+
+
+def _parse_options(options: Optional[AdapterOptions]) -> _ParsedOptions:
+    """Resolve caller options against the defaults."""
+    if not options:
+        return _DEFAULT_PARSED_OPTIONS
+    if any(callable(value) for value in options.values()):
+        # Caching would keep per-request callables (and their closures) alive
+        return _build_options(options)
+    try:
+        return _parse_option_items(frozenset(options.items()))
+    except TypeError:
+        # Unhashable option values can't be cached
+        return _build_options(options)
+
+
+@lru_cache(maxsize=64)
+def _parse_option_items(items: FrozenSet[Tuple[str, Any]]) -> _ParsedOptions:
+    """Cached _build_options for callers that reuse the same options."""
+    return _build_options(cast(AdapterOptions, dict(items)))
 
 
 class LangChainAdapter:
@@ -82,60 +309,60 @@ class LangChainAdapter:
                 - emit_start: Whether to emit start events (default: True)
                 - emit_finish: Whether to emit finish events (default: True)
                 - auto_context: Whether to automatically set up context (default: True)
+                - fast_message_id: Use cheap per-process message IDs instead of UUID4 (default: False)
+                - response_batch_bytes: Join ready chunks into buffers of up to about this many bytes (default: 0, off)
+                - response_flush_ms: Time to wait for more chunks before sending a buffer (default: 0)
         
         Returns:
             StreamingResponse: FastAPI StreamingResponse with protocol format
+        
+        Note:
+            Per-chunk scheduling cost depends on the event loop; see
+            ``enable_uvloop`` for processes not started by uvicorn.
         """
         # Parse options
-        opts = options or {}
-        protocol_version = opts.get("protocol_version", "v4")  # Default to v4
-        auto_context = opts.get("auto_context", True)
+        opts = _parse_options(options)
+        protocol_version = opts.protocol_version
+        auto_context = opts.auto_context
         
         # Create stream processor
-        message_id = message_id or str(uuid.uuid4())
+        message_id = message_id or _default_message_id(opts)
         processor = StreamProcessor(
             message_id=message_id,
-            auto_events=opts.get("auto_events", True),
+            auto_events=opts.auto_events,
             callbacks=callbacks,
             protocol_version=protocol_version
         )
         
-        # Create the async generator with automatic context management
-        async def stream_generator():
-            if auto_context:
-                # Create a temporary DataStreamWithEmitters for context
-                temp_stream = DataStreamWithEmitters(
-                    processor.process_stream(stream),
-                    message_id,
-                    opts.get("auto_close", True),
-                    processor.message_builder,
-                    callbacks,
-                    protocol_version,
-                    "protocol",
-                    processor
-                )
-                
-                # Set up context and process with lifecycle management
-                async with ContextLifecycleManager.managed_context(temp_stream):
-                    async for chunk in processor.process_stream(stream):
-                        yield chunk
-            else:
-                # Process without context management
-                async for chunk in processor.process_stream(stream):
-                    yield chunk
-        
-        # Get protocol-specific headers
-        from .protocol_strategy import ProtocolConfig
-        protocol_config = ProtocolConfig(protocol_version)
-        protocol_headers = protocol_config.strategy.get_headers()
-        if headers:
-            protocol_headers.update(headers)
+        processed_stream = processor.process_stream(stream)
+        response_stream: AsyncIterable[UIMessageChunk]
+        if auto_context:
+            # Create a temporary DataStreamWithEmitters for context; it shares
+            # the processed stream with the response
+            temp_stream = DataStreamWithEmitters(
+                processed_stream,
+                message_id,
+                opts.auto_close,
+                processor.message_builder,
+                callbacks,
+                protocol_version,
+                _OUTPUT_FORMAT,
+                processor
+            )
+            response_stream = _ContextIter(processed_stream, temp_stream)
+        else:
+            # Without context management there is nothing to wrap, so hand the
+            # processor's generator straight to the response
+            response_stream = processed_stream
         
+        # DataStreamResponse adds the protocol-specific headers under the caller's
         return DataStreamResponse(
-            stream=stream_generator(),
+            stream=response_stream,
             protocol_version=protocol_version,
             headers=headers,
-            status=status
+            status=status,
+            batch_bytes=opts.response_batch_bytes,
+            flush_ms=opts.response_flush_ms
         )
     
 
@@ -162,25 +389,22 @@ class LangChainAdapter:
                 - auto_context: Whether to automatically set up context (default: True)
                 - experimental_transform: Stream transformer function for smoothing output
                 - experimental_generateMessageId: Function to generate custom message IDs
+                - fast_message_id: Use cheap per-process message IDs instead of UUID4 (default: False)
+                - max_buffered_chunks: Unread chunks buffered before manual emits wait (default: 0, no limit)
+                - text_delta_coalesce_ms: Time emit_text_delta holds deltas to join them (default: 0, off)
 
         
         Returns:
             DataStreamWithEmitters: Stream object with emit methods
         """
         # Parse options
-        opts = options or {}
-        protocol_version = opts.get("protocol_version", "v4")  # Default to v4
-        auto_events = opts.get("auto_events", True)
-        auto_close = opts.get("auto_close", True)
-        auto_context = opts.get("auto_context", True)
-        experimental_transform = opts.get("experimental_transform")
-        experimental_generateMessageId = opts.get("experimental_generateMessageId")
-
-        # Use custom message ID generator if provided
-        if experimental_generateMessageId:
-            message_id = message_id or experimental_generateMessageId()
-        else:
-            message_id = message_id or str(uuid.uuid4())
+        opts = _parse_options(options)
+        protocol_version = opts.protocol_version
+        auto_events = opts.auto_events
+        auto_close = opts.auto_close
+        auto_context = opts.auto_context
+        experimental_transform = opts.experimental_transform
+        message_id = _resolve_message_id(message_id, opts)
         
         # Create stream processor
         processor = StreamProcessor(
@@ -190,32 +414,23 @@ class LangChainAdapter:
             protocol_version=protocol_version
         )
         
-        # Create the async generator with automatic context management
-        async def stream_generator():
-            try:
-                processed_stream = processor.process_stream(stream)
-                
-                # Apply experimental transform if provided
-                if experimental_transform:
-                    processed_stream = experimental_transform(processed_stream)
-                
-                async for chunk in processed_stream:
-                    yield chunk
-            except GeneratorExit:
-                # Generator is being closed, log for debugging and re-raise to ensure proper cleanup
-                logging.debug(f"LangChainAdapter.stream_generator: Generator exit for message {message_id}")
-                raise
+        # Apply experimental transform if provided
+        processed_stream = processor.process_stream(stream)
+        if experimental_transform is not None:
+            processed_stream = experimental_transform(processed_stream)
         
         # Create wrapped stream with emit methods
         data_stream = DataStreamWithEmitters(
-            stream_generator(), 
+            processed_stream,
             message_id, 
             auto_close, 
             processor.message_builder,
             callbacks,
             protocol_version,
-            "protocol",  # Always use protocol format
-            processor  # Pass processor instance for usage tracking
+            _OUTPUT_FORMAT,
+            processor,  # Pass processor instance for usage tracking
+            opts.max_buffered_chunks,
+            opts.text_delta_coalesce_ms
         )
         
         # Automatically set up context if enabled
@@ -226,36 +441,6 @@ class LangChainAdapter:
         
         return data_stream
     
-    @staticmethod
-    async def _process_stream_with_lifecycle(
-        stream: AsyncIterable[LangChainStreamInput],
-        data_stream: DataStreamWithEmitters,
-        processor: StreamProcessor
-    ) -> None:
-        """Process stream with automatic lifecycle management.
-        
-        Args:
-            stream: Original LangChain stream
-            data_stream: DataStreamWithEmitters instance
-            processor: StreamProcessor instance
-        """
-        try:
-            # Use context lifecycle manager
-            async with ContextLifecycleManager.managed_context(data_stream):
-                # Process the stream
-                async for chunk in processor.process_stream(stream):
-                    # Stream processing is handled by the DataStreamWithEmitters
-                    pass
-        except Exception as e:
-            # Emit error if context is available
-            context = DataStreamContext.get_current_stream()
-            if context:
-                await context.emit_error(str(e))
-            raise
-        finally:
-            # Clean up context
-            DataStreamContext.clear_current_stream()
-    
     @staticmethod
     async def merge_into_data_stream(
         stream: AsyncIterable[LangChainStreamInput],
@@ -278,15 +463,65 @@ class LangChainAdapter:
                 - auto_close: Whether to auto-close stream (default: True)
                 - emit_start: Whether to emit start events (default: True)
                 - emit_finish: Whether to emit finish events (default: True)
+                - merge_batch_size: Maximum chunks per writer call (default: 0, no limit)
+                - merge_flush_ms: Time to wait for more chunks before writing (default: 0)
         
         Returns:
             None: Merges events into the provided data_stream_writer
         """
-        # Convert to data stream
-        data_stream = LangChainAdapter.to_data_stream(
-            stream, callbacks, message_id, options
+        opts = _parse_options(options)
+        if opts.auto_context:
+            # Manual emits made through DataStreamContext are merged in by
+            # DataStreamWithEmitters, so keep the full wrapper in this case
+            data_stream = LangChainAdapter.to_data_stream(
+                stream, callbacks, message_id, options
+            )
+            
+            # Write to existing stream
+            await _write_batched(
+                data_stream, data_stream_writer, opts.merge_batch_size, opts.merge_flush_ms
+            )
+            return
+        
+        # Without context nothing can emit manually: drain the processor
+        # directly through the formatter DataStreamWithEmitters uses
+        protocol_version = opts.protocol_version
+        auto_events = opts.auto_events
+        experimental_transform = opts.experimental_transform
+        message_id = _resolve_message_id(message_id, opts)
+        
+        processor = StreamProcessor(
+            message_id=message_id,
+            auto_events=auto_events,
+            callbacks=callbacks,
+            protocol_version=protocol_version
+        )
+        processed_stream: AsyncIterable[UIMessageChunk] = processor.process_stream(stream)
+        if experimental_transform is not None:
+            processed_stream = experimental_transform(processed_stream)
+        
+        protocol_stream = _format_protocol_stream(
+            processed_stream, ProtocolConfig(protocol_version).strategy, processor
         )
+        await _write_batched(
+            protocol_stream, data_stream_writer, opts.merge_batch_size, opts.merge_flush_ms
+        )
+    
+    @staticmethod
+    def enable_uvloop() -> bool:
+        """Install uvloop as the asyncio event loop policy, if available.
+        
+        Call this before the event loop starts (e.g. before ``asyncio.run``);
+        it has no effect on a loop that is already running. Servers started
+        by ``uvicorn`` already use uvloop when it is installed.
+        
+        Returns:
+            bool: True if uvloop was installed, False if it is not available
+        """
+        try:
+            import uvloop  # type: ignore[import-not-found]
+        except ImportError:
+            return False
         
-        # Write to existing stream
-        async for chunk in data_stream:
-            await data_stream_writer.write(chunk)
\ No newline at end of file
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
@@ -29,13 +29,15 @@ class ContextLifecycleManager:
         Yields:
             Data stream instance
         """
+        # Set context; the token restores any enclosing stream on exit
+        token = DataStreamContext.set_current_stream(data_stream)
         try:
-            # Set context
-            DataStreamContext.set_current_stream(data_stream)
             yield data_stream
         finally:
-            # Clean up context
-            DataStreamContext.clear_current_stream()
+            # Clean up context. This must run inline: callbacks scheduled with
+            # loop.call_soon() run in a copy of the context, so resetting the
+            # variable there would leave this task's stream set
+            DataStreamContext.clear_current_stream(token)
     
     @staticmethod
     async def with_auto_context(
@@ -70,11 +72,15 @@ class ContextLifecycleManager:
             Decorator function
         """
         def decorator(func: Callable) -> Callable:
-            async def wrapper(*args, **kwargs):
-                async with ContextLifecycleManager.managed_context(data_stream):
-                    if asyncio.iscoroutinefunction(func):
+            # Whether func is a coroutine function can't change, so pick the
+            # wrapper once here rather than checking on every call
+            if asyncio.iscoroutinefunction(func):
+                async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                    async with ContextLifecycleManager.managed_context(data_stream):
                         return await func(*args, **kwargs)
-                    else:
+            else:
+                async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                    async with ContextLifecycleManager.managed_context(data_stream):
                         return func(*args, **kwargs)
             return wrapper
         return decorator
\ No newline at end of file
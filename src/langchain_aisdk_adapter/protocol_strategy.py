@@ -9,9 +9,17 @@ This module implements the strategy pattern to support both AI SDK v4 and v5 pro
 import json
 import uuid
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, cast
 
-from .models import UIMessageChunk
+from .models import UIMessageChunk, UIMessageChunkTextDelta
+
+# Shared encoder equivalent to json.dumps(..., ensure_ascii=False); json.dumps
+# builds a new JSONEncoder on every call that passes options
+_to_json = json.JSONEncoder(ensure_ascii=False).encode
+
+# Key layout of the text-delta chunks StreamProcessor emits, formatted by
+# AISDKv5Strategy from a template instead of a full dict encode
+_TEXT_DELTA_KEYS = ("type", "id", "delta")
 
 
 class ProtocolStrategy(ABC):
@@ -62,7 +70,7 @@ class AISDKv4Strategy(ProtocolStrategy):
             # Support both 'delta' and 'textDelta' field names for compatibility
             delta = chunk.get("delta") or chunk.get("textDelta", "")
             # Escape quotes and format as v4 text part
-            escaped_delta = json.dumps(delta, ensure_ascii=False)
+            escaped_delta = _to_json(delta)
             return f"0:{escaped_delta}\n"
         
         elif chunk_type == "text-start":
@@ -100,7 +108,7 @@ class AISDKv4Strategy(ProtocolStrategy):
                 "usage": usage,
                 "isContinued": is_continued
             }
-            return f'e:{json.dumps(step_data, ensure_ascii=False)}\n'
+            return f'e:{_to_json(step_data)}\n'
         
         elif chunk_type == "tool-input-start":
             # v4 protocol: skip tool-input-start to avoid duplicate Protocol 9 events
@@ -120,7 +128,7 @@ class AISDKv4Strategy(ProtocolStrategy):
                 "toolName": tool_name,
                 "args": args
             }
-            return f'9:{json.dumps(tool_data, ensure_ascii=False)}\n'
+            return f'9:{_to_json(tool_data)}\n'
         
         elif chunk_type == "tool-output-available":
             tool_call_id = chunk.get("toolCallId", "")
@@ -132,22 +140,22 @@ class AISDKv4Strategy(ProtocolStrategy):
                 "result": result  # Keep result as-is, don't double-serialize
             }
             
-            json_output = json.dumps(tool_data, ensure_ascii=False)
+            json_output = _to_json(tool_data)
             
             return f'a:{json_output}\n'
         
         elif chunk_type == "data":
             data = chunk.get("data", [])
-            return f'2:{json.dumps(data, ensure_ascii=False)}\n'
+            return f'2:{_to_json(data)}\n'
         
         elif chunk_type == "error":
             error_text = chunk.get("errorText", "")
-            escaped_error = json.dumps(error_text, ensure_ascii=False)
+            escaped_error = _to_json(error_text)
             return f'3:{escaped_error}\n'
         
         elif chunk_type == "reasoning":
             text = chunk.get("text", "")
-            escaped_text = json.dumps(text, ensure_ascii=False)
+            escaped_text = _to_json(text)
             return f'g:{escaped_text}\n'
         
         elif chunk_type == "source-url":
@@ -157,14 +165,14 @@ class AISDKv4Strategy(ProtocolStrategy):
                 "url": chunk.get("url", ""),
                 "title": chunk.get("title", "")
             }
-            return f'h:{json.dumps(source_data, ensure_ascii=False)}\n'
+            return f'h:{_to_json(source_data)}\n'
         
         elif chunk_type == "file":
             file_data = {
                 "data": chunk.get("data", ""),
                 "mimeType": chunk.get("mediaType", "")
             }
-            return f'k:{json.dumps(file_data, ensure_ascii=False)}\n'
+            return f'k:{_to_json(file_data)}\n'
         
         elif chunk_type == "finish":
             finish_reason = chunk.get("finishReason", "stop")
@@ -174,7 +182,7 @@ class AISDKv4Strategy(ProtocolStrategy):
                 "finishReason": finish_reason,
                 "usage": usage
             }
-            return f'd:{json.dumps(finish_data, ensure_ascii=False)}\n'
+            return f'd:{_to_json(finish_data)}\n'
         
         # For unsupported chunk types, return empty string
         return ""
@@ -212,6 +220,16 @@ class AISDKv5Strategy(ProtocolStrategy):
         if isinstance(chunk, str):
             return chunk
         
+        # Text deltas make up most of a stream; write their JSON directly,
+        # in the same form json.dumps produces
+        if (type(chunk) is dict and chunk.get("type") == "text-delta"
+                and tuple(chunk) == _TEXT_DELTA_KEYS):
+            text_delta = cast(UIMessageChunkTextDelta, chunk)
+            return (
+                f'data: {{"type": "text-delta", "id": {_to_json(text_delta["id"])}, '
+                f'"delta": {_to_json(text_delta["delta"])}}}\n\n'
+            )
+        
         # Convert chunk to JSON string
         if hasattr(chunk, 'dict'):
             chunk_dict = chunk.dict()
@@ -221,12 +239,12 @@ class AISDKv5Strategy(ProtocolStrategy):
             chunk_dict = {"type": "error", "errorText": "Invalid chunk format"}
         
         # Format as SSE: data: CONTENT_JSON\n\n
-        json_str = json.dumps(chunk_dict, ensure_ascii=False)
+        json_str = _to_json(chunk_dict)
         return f"data: {json_str}\n\n"
     
     def convert_text_sequence(self, text_chunks: List[str]) -> List[UIMessageChunk]:
         """Convert text sequence to v5 format (start/delta/end sequence)."""
-        text_id = str(uuid.uuid4())
+        text_id = uuid.uuid4().hex
         chunks = [{"type": "text-start", "id": text_id}]
         
         for chunk in text_chunks:
@@ -244,6 +262,13 @@ class AISDKv5Strategy(ProtocolStrategy):
         return "data: [DONE]\n\n"
 
 
+# Strategies are stateless, so every ProtocolConfig shares one instance per version
+_STRATEGIES: Dict[str, ProtocolStrategy] = {
+    "v4": AISDKv4Strategy(),
+    "v5": AISDKv5Strategy(),
+}
+
+
 class ProtocolConfig:
     """Protocol configuration manager."""
     
@@ -257,10 +282,8 @@ class ProtocolConfig:
         self.strategy = self._create_strategy()
     
     def _create_strategy(self) -> ProtocolStrategy:
-        """Create protocol strategy based on version."""
-        if self.version == "v4":
-            return AISDKv4Strategy()
-        elif self.version == "v5":
-            return AISDKv5Strategy()
-        else:
-            raise ValueError(f"Unsupported protocol version: {self.version}")
\ No newline at end of file
+        """Get the shared protocol strategy for this version."""
+        strategy = _STRATEGIES.get(self.version)
+        if strategy is None:
+            raise ValueError(f"Unsupported protocol version: {self.version}")
+        return strategy
\ No newline at end of file
@@ -6,7 +6,8 @@ offering controlled chunking and timing for text streams as an optional feature.
 
 import asyncio
 import re
-from typing import AsyncIterable, AsyncGenerator, Union, Literal, Callable, List
+from functools import partial
+from typing import AsyncIterable, AsyncGenerator, Union, Literal, Callable, Iterable, Iterator, List
 
 
 class SmoothStreamTransformer:
@@ -16,6 +17,18 @@ class SmoothStreamTransformer:
     providing controlled chunking and timing for text streams.
     """
     
+    # Fixed attribute layout: one transformer is created per stream and its
+    # buffer state is read and written for every upstream chunk
+    __slots__ = (
+        "stream",
+        "delay_in_ms",
+        "chunking",
+        "_buffer",
+        "_pending",
+        "_chunk_buffer",
+        "_separator",
+    )
+    
     def __init__(
         self,
         stream: AsyncIterable[str],
@@ -26,13 +39,30 @@ class SmoothStreamTransformer:
         self.delay_in_ms = delay_in_ms
         self.chunking = chunking
         self._buffer = ""
-        self._is_protocol_format = False
+        # Text received since the last separator, joined into _buffer lazily
+        self._pending: List[str] = []
+        # Resolve the chunking strategy once rather than on every buffer flush
+        self._chunk_buffer = self._resolve_chunker(chunking)
+        # Word and line chunking can only emit once their separator arrives
+        self._separator = ' ' if chunking == 'word' else '\n' if chunking == 'line' else None
     
     def __aiter__(self):
         return self._transform()
     
     async def _transform(self) -> AsyncGenerator[str, None]:
         """Transform the input stream with smooth chunking and delays."""
+        # Local aliases for names used on every chunk
+        clock = asyncio.get_running_loop().time
+        sleep = asyncio.sleep
+        feed = self._feed
+        delay = self.delay_in_ms / 1000.0
+        # Chunks are paced against a deadline: we only sleep when the next
+        # chunk is ready before delay_in_ms has passed since the previous one,
+        # so a producer or consumer slower than the delay never hits a timer
+        next_emit = 0.0
+        # Whether the input uses AI SDK protocol dicts, decides the form of
+        # the final flush
+        is_protocol_format = False
         try:
             async for chunk in self.stream:
                 if not chunk:
@@ -41,43 +71,52 @@ class SmoothStreamTransformer:
                 # Handle both string chunks and AI SDK protocol chunks
                 if isinstance(chunk, dict):
                     # Handle AI SDK protocol format
-                    self._is_protocol_format = True
+                    is_protocol_format = True
                     if chunk.get('type') == 'text':
                         text_content = chunk.get('content', '')
                         if text_content:
-                            self._buffer += text_content
-                            
                             # Process buffer based on chunking strategy
-                            chunks_to_yield = self._process_buffer()
+                            chunks_to_yield = feed(text_content)
                             
                             for processed_chunk in chunks_to_yield:
                                 if processed_chunk:
+                                    if delay > 0:
+                                        wait = next_emit - clock()
+                                        if wait > 0:
+                                            await sleep(wait)
                                     # Yield in AI SDK protocol format
                                     yield {'type': 'text', 'content': processed_chunk}
-                                    if self.delay_in_ms > 0:
-                                        await asyncio.sleep(self.delay_in_ms / 1000.0)
+                                    if delay > 0:
+                                        next_emit = clock() + delay
                     else:
                         # Pass through non-text chunks immediately
                         yield chunk
                 elif isinstance(chunk, str):
-                    # Handle plain string chunks
-                    self._buffer += chunk
-                    
-                    # Process buffer based on chunking strategy
-                    chunks_to_yield = self._process_buffer()
+                    # Handle plain string chunks, processing the buffer
+                    # based on the chunking strategy
+                    chunks_to_yield = feed(chunk)
                     
                     for processed_chunk in chunks_to_yield:
                         if processed_chunk:
+                            if delay > 0:
+                                wait = next_emit - clock()
+                                if wait > 0:
+                                    await sleep(wait)
                             yield processed_chunk
-                            if self.delay_in_ms > 0:
-                                await asyncio.sleep(self.delay_in_ms / 1000.0)
+                            if delay > 0:
+                                next_emit = clock() + delay
                 else:
                     # Pass through other chunk types
                     yield chunk
             
             # Yield any remaining buffer content
+            self._join_pending()
             if self._buffer:
-                if self._is_protocol_format:
+                if delay > 0:
+                    wait = next_emit - clock()
+                    if wait > 0:
+                        await sleep(wait)
+                if is_protocol_format:
                     # If we were processing AI SDK protocol, yield in that format
                     yield {'type': 'text', 'content': self._buffer}
                 else:
@@ -87,84 +126,111 @@ class SmoothStreamTransformer:
                 
         except Exception as e:
             # Ensure any remaining buffer is yielded on error
+            self._join_pending()
             if self._buffer:
                 yield self._buffer
             raise e
     
-    def _process_buffer(self) -> List[str]:
-        """Process the buffer based on the chunking strategy."""
-        if not self._buffer:
-            return []
-        
-        if self.chunking == 'word':
-            return self._chunk_by_word()
-        elif self.chunking == 'line':
-            return self._chunk_by_line()
-        elif isinstance(self.chunking, re.Pattern):
-            return self._chunk_by_regex(self.chunking)
-        elif callable(self.chunking):
-            return self._chunk_by_function(self.chunking)
+    def _resolve_chunker(
+        self,
+        chunking: Union[Literal['word', 'line'], re.Pattern, Callable[[str], List[str]]]
+    ) -> Callable[[], Iterable[str]]:
+        """Map a chunking strategy to the bound method that implements it."""
+        if chunking == 'word':
+            return self._chunk_by_word
+        elif chunking == 'line':
+            return self._chunk_by_line
+        elif isinstance(chunking, re.Pattern):
+            return partial(self._chunk_by_regex, chunking)
+        elif callable(chunking):
+            return partial(self._chunk_by_function, chunking)
         else:
-            # Default: return the entire buffer
-            result = [self._buffer]
-            self._buffer = ""
-            return result
+            return self._chunk_whole_buffer
     
-    def _chunk_by_word(self) -> List[str]:
-        """Chunk by word boundaries."""
-        words = self._buffer.split(' ')
-        if len(words) <= 1:
+    def _feed(self, text: str) -> Iterable[str]:
+        """Append text to the buffer and return the chunks now complete."""
+        self._pending.append(text)
+        if self._separator is not None and self._separator not in text:
+            # Nothing new can complete, so skip rescanning the whole buffer;
+            # a long run without separators (e.g. CJK text in word mode)
+            # would otherwise cost O(n^2) in copies and scans
             return []
-        
-        # Keep the last word in buffer (might be incomplete)
-        complete_words = words[:-1]
-        self._buffer = words[-1]
-        
-        # Return words with spaces
-        result = []
-        for i, word in enumerate(complete_words):
-            if i == 0:
-                result.append(word + ' ')
-            else:
-                result.append(word + ' ')
-        
+        # The buffer now holds at least this non-empty text
+        self._join_pending()
+        return self._chunk_buffer()
+    
+    def _join_pending(self) -> None:
+        """Fold pending text into the buffer."""
+        if self._pending:
+            self._buffer += "".join(self._pending)
+            self._pending.clear()
+    
+    def _chunk_whole_buffer(self) -> List[str]:
+        """Default: return the entire buffer."""
+        result = [self._buffer]
+        self._buffer = ""
         return result
     
-    def _chunk_by_line(self) -> List[str]:
-        """Chunk by line boundaries."""
-        lines = self._buffer.split('\n')
-        if len(lines) <= 1:
-            return []
-        
-        # Keep the last line in buffer (might be incomplete)
-        complete_lines = lines[:-1]
-        self._buffer = lines[-1]
+    def _chunk_by_word(self) -> Iterable[str]:
+        """Chunk by word boundaries, yielding each word with its space."""
+        return self._chunk_by_separator(' ')
+    
+    def _chunk_by_line(self) -> Iterable[str]:
+        """Chunk by line boundaries, yielding each line with its newline.
         
-        # Return lines with newlines
-        return [line + '\n' for line in complete_lines]
+        Only '\\n' counts as a line break here, so str.splitlines (which
+        also splits on '\\r' and others) is not used.
+        """
+        return self._chunk_by_separator('\n')
     
-    def _chunk_by_regex(self, pattern: re.Pattern) -> List[str]:
-        """Chunk by regex pattern."""
-        matches = list(pattern.finditer(self._buffer))
-        if not matches:
-            return []
+    def _chunk_by_separator(self, separator: str) -> Iterable[str]:
+        """Split complete chunks ending in separator off the buffer."""
+        text = self._buffer
+        end = text.find(separator) + 1
+        if end == len(text):
+            # Common case of a token finishing exactly one word or line: the
+            # whole buffer is the chunk, so skip slicing and the generator
+            self._buffer = ""
+            return (text,)
+        return self._iter_separated(text, separator, end - 1)
+    
+    def _iter_separated(self, text: str, separator: str, end: int) -> Iterator[str]:
+        """Yield complete chunks ending in separator straight from text.
         
-        result = []
+        Chunks are sliced off as they are consumed instead of building
+        intermediate lists; the incomplete tail is kept in the buffer once
+        the generator is exhausted.
+        """
+        find = text.find
+        pos = 0
+        while end != -1:
+            end += 1
+            yield text[pos:end]
+            pos = end
+            end = find(separator, pos)
+        
+        # Keep the last chunk in buffer (might be incomplete)
+        self._buffer = text[pos:]
+    
+    def _chunk_by_regex(self, pattern: re.Pattern) -> Iterator[str]:
+        """Chunk by regex pattern, yielding text between and including matches."""
+        text = self._buffer
         last_end = 0
         
-        for match in matches:
-            # Add text before the match
-            if match.start() > last_end:
-                result.append(self._buffer[last_end:match.start()])
+        for match in pattern.finditer(text):
+            start = match.start()
+            # Yield text before the match
+            if start > last_end:
+                yield text[last_end:start]
             
-            # Add the match itself
-            result.append(match.group())
-            last_end = match.end()
+            # Yield the match itself, skipping empty matches
+            end = match.end()
+            if end > start:
+                yield text[start:end]
+            last_end = end
         
         # Update buffer with remaining text
-        self._buffer = self._buffer[last_end:]
-        
-        return [chunk for chunk in result if chunk]
+        self._buffer = text[last_end:]
     
     def _chunk_by_function(self, func: Callable[[str], List[str]]) -> List[str]:
         """Chunk using a custom function."""
@@ -193,7 +259,7 @@ def smooth_stream(
     delay_in_ms: int = 10,
     chunking: Union[Literal['word', 'line'], re.Pattern, Callable[[str], List[str]]] = 'word'
 ) -> Callable[[AsyncIterable[str]], AsyncIterable[str]]:
-    """Create a smooth stream transform function for experimental_transform.
+    r"""Create a smooth stream transform function for experimental_transform.
     
     This function provides smooth streaming capabilities similar to AI SDK's smoothStream,
     allowing you to control how text is chunked and the delay between chunks.
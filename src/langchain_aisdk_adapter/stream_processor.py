@@ -1,13 +1,16 @@
 """Stream processor for converting LangChain events to AI SDK format."""
 
 import asyncio
+import json
 import logging
+import re
 import uuid
-from typing import AsyncGenerator, AsyncIterable, Dict, Any, Optional, Callable
+from typing import AsyncGenerator, AsyncIterable, Dict, Any, List, Optional, Callable, cast
 
 from .models import (
     LangChainStreamInput,
     LangChainStreamEvent,
+    LangChainStreamEventData,
     LangChainAIMessageChunk,
     UIMessageChunk,
     UIMessageChunkStart,
@@ -20,12 +23,59 @@ from .models import (
 )
 from .message_builder import MessageBuilder
 from .protocol_generator import ProtocolGenerator
-from .callbacks import BaseAICallbackHandler
+from .callbacks import BaseAICallbackHandler, TextUIPart
+
+
+# Sentinel for tool calls whose output is not known yet
+_NO_OUTPUT = object()
+
+# Tool output that looks like a JSON object or array; matching skips leading
+# whitespace without copying the (possibly large) output the way strip() does
+_JSON_CONTAINER_START = re.compile(r"\s*[\[{]")
+
+# Shared read-only default for events without a "data"/"metadata" payload
+_EMPTY: Dict[str, Any] = {}
+
+
+def _is_langgraph_event(event: Dict[str, Any]) -> bool:
+    """Check whether an event carries LangGraph metadata (langgraph_* keys)."""
+    metadata = event.get("metadata")
+    if not metadata:
+        return False
+    for key in metadata:
+        if key.startswith("langgraph"):
+            return True
+    return False
 
 
 class StreamProcessor:
     """Core stream processing logic for converting LangChain events to AI SDK format."""
 
+    # One processor is created per request, so keep instances dict-free
+    __slots__ = (
+        "message_id",
+        "auto_events",
+        "callbacks",
+        "protocol_version",
+        "message_builder",
+        "_current_text_id",
+        "_tool_calls",
+        "_accumulated_text",
+        "current_step_id",
+        "current_usage",
+        "current_step_active",
+        "llm_generation_complete",
+        "has_text_started",
+        "tool_completed_in_current_step",
+        "need_new_step_for_text",
+        "step_count",
+        "text_id",
+        "_pending_text",
+        "tool_calls",
+        "_id_prefix",
+        "_id_seq",
+    )
+
     def __init__(
         self,
         message_id: str,
@@ -38,13 +88,29 @@ class StreamProcessor:
         self.callbacks = callbacks
         self.protocol_version = protocol_version
         self.message_builder = MessageBuilder(message_id)
-        self._lock = asyncio.Lock()
         self._current_text_id: Optional[str] = None
         self._tool_calls: Dict[str, Dict[str, Any]] = {}
         self._accumulated_text = ""
         self.current_step_id: Optional[str] = None
         self.current_usage: Dict[str, int] = {"promptTokens": 0, "completionTokens": 0}
         
+        # Per-stream state, reset at the start of every process_stream() call.
+        # Declared here with concrete types so the class has a fixed attribute layout.
+        self.current_step_active: bool = False
+        self.llm_generation_complete: bool = False
+        self.has_text_started: bool = False
+        self.tool_completed_in_current_step: bool = False
+        self.need_new_step_for_text: bool = False
+        self.step_count: int = 0
+        self.text_id: str = ""
+        self._pending_text: str = ""
+        self.tool_calls: Dict[str, Dict[str, Any]] = {}
+        
+        # Text and step IDs are a per-processor random prefix plus a counter,
+        # so only one uuid4() is generated per processor
+        self._id_prefix: str = uuid.uuid4().hex
+        self._id_seq: int = 0
+        
     async def process_stream(
         self,
         stream: AsyncIterable[LangChainStreamInput],
@@ -54,6 +120,11 @@ class StreamProcessor:
         
         # Use passed callbacks or fallback to instance callbacks
         active_callbacks = callbacks or self.callbacks
+        ai_callbacks = active_callbacks if isinstance(active_callbacks, BaseAICallbackHandler) else None
+        
+        # Message history is only read back to build the on_finish message,
+        # so skip recording it when no AI SDK callback handler is registered
+        record_history = ai_callbacks is not None
         
         # Initialize state variables
         self.current_step_active = False
@@ -62,41 +133,46 @@ class StreamProcessor:
         self.tool_completed_in_current_step = False
         self.need_new_step_for_text = False
         self.step_count = 0
-        self.text_id = f"text-{uuid.uuid4()}"
+        self.text_id = f"text-{self._next_id()}"
+        self._pending_text = ""
         self.tool_calls = {}
-        self.current_usage: Dict[str, int] = {"promptTokens": 0, "completionTokens": 0}
+        self.current_usage = {"promptTokens": 0, "completionTokens": 0}
         
         try:
             # Create and process start event only if auto_events is True
             if self.auto_events:
                 start_chunk = self._create_start_event()
-                await self.message_builder.add_chunk(start_chunk)
+                if record_history:
+                    await self.message_builder.add_chunk(start_chunk)
                 yield start_chunk
             
             # Process stream events
             async for event in self._process_langchain_events(stream):
                 # Only accumulate parts and yield events if auto_events is True
                 if self.auto_events:
-                    await self.message_builder.add_chunk(event)
+                    if record_history:
+                        await self.message_builder.add_chunk(event)
                     yield event
             
             # Create and process final finish-step if there's an active step and LLM generation is complete
             # This handles the case where LLM generates only text without tool calls
             if self.current_step_active and self.llm_generation_complete and self.auto_events:
                 finish_step_chunk = self._create_finish_step_event()
-                await self.message_builder.add_chunk(finish_step_chunk)
+                if record_history:
+                    await self.message_builder.add_chunk(finish_step_chunk)
                 yield finish_step_chunk
                 self.current_step_active = False
                 self.llm_generation_complete = False
                 
             # Always handle AI SDK callbacks if provided, regardless of auto_events
-            if isinstance(active_callbacks, BaseAICallbackHandler):
-                await self._handle_ai_sdk_callbacks(active_callbacks)
+            if ai_callbacks is not None:
+                await self._handle_ai_sdk_callbacks(ai_callbacks)
             
             # Create and process finish event only if auto_events is True
             if self.auto_events:
                 finish_chunk = self._create_finish_event()
-                await self.message_builder.add_chunk(finish_chunk)
+                if record_history:
+                    await self.message_builder.add_chunk(finish_chunk)
                 yield finish_chunk
                 
         except GeneratorExit:
@@ -104,8 +180,8 @@ class StreamProcessor:
             logging.debug(f"StreamProcessor.process_stream: Generator exit for message {self.message_id}")
             raise
         except Exception as e:
-            if isinstance(active_callbacks, BaseAICallbackHandler):
-                await active_callbacks.on_error(e)
+            if ai_callbacks is not None:
+                await ai_callbacks.on_error(e)
             raise
     
     async def _process_langchain_events(
@@ -116,25 +192,27 @@ class StreamProcessor:
         
         try:
             async for value in stream:
-                # Handle string stream (direct text output)
-                if isinstance(value, str):
-                    async for chunk in self._handle_incremental_text(value):
-                        yield chunk
+                # Handle LangChain stream events v2; dicts are by far the most
+                # common values, so they are tested first with a single check
+                if isinstance(value, dict):
+                    if "event" in value:
+                        event = cast(LangChainStreamEvent, value)
+                        if event["event"] == "on_chat_model_stream":
+                            # Token events dominate the stream; convert them here
+                            # instead of starting a _handle_stream_event generator
+                            for chunk in self._handle_chat_model_stream(event.get("data", {})):
+                                yield chunk
+                            continue
+                        async for chunk in self._handle_stream_event(event):
+                            yield chunk
+                    # AI message chunk dicts ("content" without "event") are skipped to avoid
+                    # duplication: their text is processed through on_chat_model_stream events
                     continue
                 
-                # Handle LangChain stream events v2
-                if isinstance(value, dict) and "event" in value:
-                    event: LangChainStreamEvent = value
-                    async for chunk in self._handle_stream_event(event):
+                # Handle string stream (direct text output)
+                if isinstance(value, str):
+                    for chunk in self._handle_incremental_text(value):
                         yield chunk
-                    continue
-                
-                # Handle AI message chunk stream (but skip text processing here to avoid duplication)
-                # Text content from AI message chunks will be handled by the event stream processing
-                if isinstance(value, dict) and "content" in value:
-                    # Skip text processing here to avoid duplication with event stream
-                    # The text content will be processed through on_chat_model_stream events
-                    continue
         except GeneratorExit:
             # Generator is being closed, log for debugging and re-raise to ensure proper cleanup
             logging.debug(f"StreamProcessor._process_langchain_events: Generator exit for message {self.message_id}")
@@ -159,11 +237,51 @@ class StreamProcessor:
             "output": output
         }
     
+    def _create_tool_call_chunks(
+        self,
+        tool_call_id: str,
+        tool_name: str,
+        tool_input: Any,
+        output: Any = _NO_OUTPUT
+    ) -> List[UIMessageChunk]:
+        """Record a tool call and create its chunk sequence.
+        
+        Returns tool-input-start, tool-input-delta and tool-input-available chunks,
+        followed by tool-output-available when an output is already known.
+        """
+        has_output = output is not _NO_OUTPUT
+        self.tool_calls[tool_call_id] = {
+            "name": tool_name,
+            "inputs": tool_input,
+            "outputs": output if has_output else None,
+            "state": "result" if has_output else "running"
+        }
+        
+        # Serialize the input as JSON for the delta
+        input_json = json.dumps(tool_input if isinstance(tool_input, dict) else {"input": tool_input})
+        chunks: List[UIMessageChunk] = [
+            self._create_tool_input_start_chunk(tool_call_id, tool_name),
+            {
+                "type": "tool-input-delta",
+                "toolCallId": tool_call_id,
+                "inputTextDelta": input_json
+            },
+            {
+                "type": "tool-input-available",
+                "toolCallId": tool_call_id,
+                "toolName": tool_name,
+                "input": tool_input
+            }
+        ]
+        if has_output:
+            chunks.append(self._create_tool_output_available_chunk(tool_call_id, output))
+        return chunks
+    
     def _create_start_step_chunk(self) -> UIMessageChunkStartStep:
         """Create start step chunk."""
         return {
             "type": "start-step",
-            "messageId": self.current_step_id or str(uuid.uuid4())
+            "messageId": self.current_step_id or self._next_id()
         }
     
     def _create_finish_step_chunk(self) -> UIMessageChunkFinishStep:
@@ -172,22 +290,19 @@ class StreamProcessor:
         finish_reason = "tool-calls" if self.tool_completed_in_current_step else "stop"
         
         # Use actual usage values from LangChain events
-        usage = self.current_usage.copy()
-        
         return {
             "type": "finish-step",
             "finishReason": finish_reason,
-            "usage": usage,
+            "usage": self.current_usage.copy(),
             "isContinued": False
         }
     
     def _create_start_chunk(self) -> UIMessageChunkStart:
         """Create start chunk."""
-        chunk = {
+        return {
             "type": "start",
             "messageId": self.message_id
         }
-        return chunk
     
     def _create_finish_chunk(self) -> UIMessageChunkFinish:
         """Create finish chunk."""
@@ -204,7 +319,12 @@ class StreamProcessor:
             "errorText": error_text
         }
     
-    async def _call_callback(self, callback: Optional[Callable], *args) -> None:
+    def _next_id(self) -> str:
+        """Generate an ID that is unique across processors without a uuid4() call."""
+        self._id_seq += 1
+        return f"{self._id_prefix}-{self._id_seq}"
+    
+    async def _call_callback(self, callback: Optional[Callable[..., Any]], *args: Any) -> None:
         """Safely call a callback function, handling both sync and async callbacks."""
         if callback is None:
             return
@@ -229,14 +349,8 @@ class StreamProcessor:
                 async for chunk in self._handle_chat_model_start(data):
                     yield chunk
             elif event_type == "on_chat_model_stream":
-                chunk_data = data.get("chunk")
-                if chunk_data:
-                    text = self._extract_text_from_chunk(chunk_data)
-                    if text:
-                        # LangChain chunks are incremental, use them directly as delta
-                        self._accumulated_text += text
-                        async for ui_chunk in self._handle_incremental_text(text):
-                            yield ui_chunk
+                for ui_chunk in self._handle_chat_model_stream(data):
+                    yield ui_chunk
             elif event_type == "on_chat_model_end":
                 async for chunk in self._handle_chat_model_end(data):
                     yield chunk
@@ -261,14 +375,26 @@ class StreamProcessor:
             logging.debug(f"StreamProcessor._handle_stream_event: Generator exit for message {self.message_id}")
             raise
     
+    def _handle_chat_model_stream(self, data: LangChainStreamEventData) -> List[UIMessageChunk]:
+        """Handle chat model stream event."""
+        chunk_data = data.get("chunk")
+        if chunk_data:
+            text = self._extract_text_from_chunk(chunk_data)
+            if text:
+                # LangChain chunks are incremental, use them directly as delta
+                self._accumulated_text += text
+                return self._handle_incremental_text(text)
+        return []
+    
     async def _handle_chat_model_start(self, data: Dict[str, Any]) -> AsyncGenerator[UIMessageChunk, None]:
         """Handle chat model start event."""
         if not self.current_step_active:
             self.step_count += 1
             # Generate a unique step ID for this step
-            self.current_step_id = str(uuid.uuid4())
-            self.text_id = f"text-{uuid.uuid4()}"
+            self.current_step_id = self._next_id()
+            self.text_id = f"text-{self._next_id()}"
             self.has_text_started = False
+            self._pending_text = ""
             self._accumulated_text = ""
             # Only create start-step event for the first step
             # Subsequent steps after tool calls should not create new start-step events
@@ -313,7 +439,8 @@ class StreamProcessor:
                     "completionTokens": usage_metadata.get("output_tokens", 0)
                 }
         
-        # End text if it was started
+        # End text if it was started; whitespace that never led to text is dropped
+        self._pending_text = ""
         if self.has_text_started:
             yield ProtocolGenerator.create_text_end(self.text_id, self._accumulated_text, self.protocol_version)
             self.has_text_started = False
@@ -333,21 +460,17 @@ class StreamProcessor:
         Traditional LangChain tool events are handled via intermediate_steps.
         """
         # Check if this is a LangGraph tool event by looking for langgraph metadata
-        metadata = event.get("metadata", {})
-        is_langgraph = any(key.startswith("langgraph") for key in metadata.keys())
-        
-        if not is_langgraph:
+        if not _is_langgraph_event(event):
             # Skip traditional LangChain tool events - they will be handled via intermediate_steps
             return
             yield  # Make this a generator function
         
         # Process LangGraph tool events with complete information
-        data = event.get("data", {})
         tool_name = event.get("name", "")
         run_id = event.get("run_id", "")
         
         # LangGraph tool events have input data in data.input
-        tool_input = data.get("input")
+        tool_input = (event.get("data") or _EMPTY).get("input")
         
         if tool_input is not None and tool_name and run_id:
             # This is a LangGraph tool event with complete information
@@ -355,44 +478,15 @@ class StreamProcessor:
             
             # Only process if we haven't seen this tool call before
             if tool_call_id not in self.tool_calls:
-                # Store tool call info (without output yet)
-                self.tool_calls[tool_call_id] = {
-                    "name": tool_name,
-                    "inputs": tool_input,
-                    "outputs": None,  # Will be filled in _handle_tool_end
-                    "state": "running"
-                }
-                
-                # Emit tool input start
-                yield {
-                    "type": "tool-input-start",
-                    "toolCallId": tool_call_id,
-                    "toolName": tool_name
-                }
-                
-                # Emit tool input delta (serialize the input as JSON)
-                import json
-                input_json = json.dumps(tool_input if isinstance(tool_input, dict) else {"input": tool_input})
-                yield {
-                    "type": "tool-input-delta",
-                    "toolCallId": tool_call_id,
-                    "inputTextDelta": input_json
-                }
-                
-                # Emit tool input available
-                yield {
-                    "type": "tool-input-available",
-                    "toolCallId": tool_call_id,
-                    "toolName": tool_name,
-                    "input": tool_input
-                }
+                # Output is filled in by _handle_tool_end
+                for chunk in self._create_tool_call_chunks(tool_call_id, tool_name, tool_input):
+                    yield chunk
         
         return
         yield  # Make this a generator function
     
     def _serialize_tool_output(self, output: Any) -> Any:
         """Serialize tool output to ensure JSON compatibility."""
-        import json
         
         if hasattr(output, 'content'):
             # Handle LangChain ToolMessage or similar objects
@@ -439,21 +533,17 @@ class StreamProcessor:
         Traditional LangChain tool events are handled via intermediate_steps.
         """
         # Check if this is a LangGraph tool event by looking for langgraph metadata
-        metadata = event.get("metadata", {})
-        is_langgraph = any(key.startswith("langgraph") for key in metadata.keys())
-        
-        if not is_langgraph:
+        if not _is_langgraph_event(event):
             # Skip traditional LangChain tool events - they will be handled via intermediate_steps
             return
             yield  # Make this a generator function
         
         # Process LangGraph tool events with complete information
-        data = event.get("data", {})
         tool_name = event.get("name", "")
         run_id = event.get("run_id", "")
         
         # LangGraph tool events have output data in data.output
-        tool_output = data.get("output")
+        tool_output = (event.get("data") or _EMPTY).get("output")
         
         if tool_output is not None and tool_name and run_id:
             # This is a LangGraph tool event with complete information
@@ -515,7 +605,7 @@ class StreamProcessor:
             async for ui_chunk in self._process_intermediate_steps(input_data["intermediate_steps"]):
                 yield ui_chunk
     
-    async def _process_intermediate_steps(self, intermediate_steps) -> AsyncGenerator[UIMessageChunk, None]:
+    async def _process_intermediate_steps(self, intermediate_steps: Any) -> AsyncGenerator[UIMessageChunk, None]:
         """Process intermediate steps to extract tool calls.
         
         Supports both traditional ReAct agent format (action, result) tuples
@@ -548,49 +638,10 @@ class StreamProcessor:
                     
                     # Only process if we haven't seen this tool call before
                     if tool_call_id not in self.tool_calls:
-                        # Store tool call info
-                        self.tool_calls[tool_call_id] = {
-                            "name": tool_name,
-                            "inputs": tool_input,
-                            "outputs": result,
-                            "state": "result"
-                        }
-                        
                         # Emit complete tool input sequence for v5 compatibility
                         # v4 protocol will filter out unwanted events in protocol_strategy.py
-                        
-                        # Emit tool input start
-                        yield {
-                            "type": "tool-input-start",
-                            "toolCallId": tool_call_id,
-                            "toolName": tool_name
-                        }
-                        
-                        # Emit tool input delta (serialize the input as JSON)
-                        import json
-                        input_json = json.dumps(tool_input if isinstance(tool_input, dict) else {"input": tool_input})
-                        yield {
-                            "type": "tool-input-delta",
-                            "toolCallId": tool_call_id,
-                            "inputTextDelta": input_json
-                        }
-                        
-                        # Emit tool input available
-                        yield {
-                            "type": "tool-input-available",
-                            "toolCallId": tool_call_id,
-                            "toolName": tool_name,
-                            "input": tool_input
-                        }
-                        
-                        # Emit tool output available
-                        yield {
-                            "type": "tool-output-available",
-                            "toolCallId": tool_call_id,
-                            "output": result
-                        }
-                        
-                        # Tool invocation will be handled by MessageBuilder
+                        for chunk in self._create_tool_call_chunks(tool_call_id, tool_name, tool_input, result):
+                            yield chunk
                         
                         # Mark that we have completed a tool call in this step
                 self.tool_completed_in_current_step = True
@@ -608,15 +659,15 @@ class StreamProcessor:
             self.need_new_step_for_text = True
             self.llm_generation_complete = False
     
-    async def _process_langgraph_messages(self, messages) -> AsyncGenerator[UIMessageChunk, None]:
+    async def _process_langgraph_messages(self, messages: List[Any]) -> AsyncGenerator[UIMessageChunk, None]:
         """Process LangGraph messages format to extract tool calls.
         
         LangGraph intermediate_steps contains a list of messages including:
         - AIMessage with tool_calls
         - ToolMessage with results
         """
-        tool_calls_map = {}  # Map tool_call_id to tool info
-        tool_results_map = {}  # Map tool_call_id to results
+        tool_calls_map: Dict[str, Dict[str, Any]] = {}  # Map tool_call_id to tool info
+        tool_results_map: Dict[str, Any] = {}  # Map tool_call_id to results
         
         # First pass: collect tool calls and results
         for message in messages:
@@ -637,10 +688,9 @@ class StreamProcessor:
                 content = message.content
                 if isinstance(content, str):
                     try:
-                        import json
                         import ast
                         # First try JSON parsing (for proper JSON strings)
-                        if content.strip().startswith(('{', '[')):
+                        if _JSON_CONTAINER_START.match(content):
                             try:
                                 content = json.loads(content)
                             except json.JSONDecodeError:
@@ -662,69 +712,50 @@ class StreamProcessor:
                 tool_args = tool_info['args']
                 tool_result = tool_results_map[tool_call_id]
                 
-                # Store tool call info
-                self.tool_calls[tool_call_id] = {
-                    "name": tool_name,
-                    "inputs": tool_args,
-                    "outputs": tool_result,
-                    "state": "result"
-                }
-                
-                # Emit tool input start
-                yield {
-                    "type": "tool-input-start",
-                    "toolCallId": tool_call_id,
-                    "toolName": tool_name
-                }
-                
-                # Emit tool input delta (serialize the input as JSON)
-                import json
-                input_json = json.dumps(tool_args if isinstance(tool_args, dict) else {"input": tool_args})
-                yield {
-                    "type": "tool-input-delta",
-                    "toolCallId": tool_call_id,
-                    "inputTextDelta": input_json
-                }
-                
-                # Emit tool input available
-                yield {
-                    "type": "tool-input-available",
-                    "toolCallId": tool_call_id,
-                    "toolName": tool_name,
-                    "input": tool_args
-                }
-                
-                # Emit tool output available
-                yield {
-                    "type": "tool-output-available",
-                    "toolCallId": tool_call_id,
-                    "output": tool_result
-                }
+                for chunk in self._create_tool_call_chunks(tool_call_id, tool_name, tool_args, tool_result):
+                    yield chunk
                 
                 # Mark that we have completed a tool call in this step
                 self.tool_completed_in_current_step = True
     
-    async def _handle_incremental_text(self, text: str) -> AsyncGenerator[UIMessageChunk, None]:
-        """Handle incremental text content using unified protocol generator."""
-        try:
-            if not text:
-                return
-            
-            # Start text if not already started
-            if not self.has_text_started:
-                yield ProtocolGenerator.create_text_start(self.text_id, self.protocol_version)
-                self.has_text_started = True
-            
-            # Send text delta
-            yield ProtocolGenerator.create_text_delta(self.text_id, text, self.protocol_version)
-        except GeneratorExit:
-            # Generator is being closed, log for debugging and re-raise to ensure proper cleanup
-            logging.debug(f"StreamProcessor._handle_incremental_text: Generator exit for message {self.message_id}")
-            raise
+    def _handle_incremental_text(self, text: str) -> List[UIMessageChunk]:
+        """Handle incremental text content using unified protocol generator.
+        
+        Returns the chunks as a list so callers can forward a whole batch without
+        creating an intermediate async generator for every streamed token.
+        """
+        if not text:
+            return []
+        
+        if not self.has_text_started:
+            # Hold whitespace-only deltas until real text arrives so that blank
+            # generations (e.g. a newline before a tool call) emit no text chunks
+            if text.isspace():
+                self._pending_text += text
+                return []
+            if self._pending_text:
+                text = self._pending_text + text
+                self._pending_text = ""
+        
+        # Send text delta
+        delta_chunk = ProtocolGenerator.create_text_delta(self.text_id, text, self.protocol_version)
+        if self.has_text_started:
+            return [delta_chunk]
+        
+        # Start text if not already started
+        self.has_text_started = True
+        return [ProtocolGenerator.create_text_start(self.text_id, self.protocol_version), delta_chunk]
     
     def _extract_text_from_chunk(self, chunk: LangChainAIMessageChunk) -> str:
         """Extract text content from LangChain AI message chunk."""
-        if isinstance(chunk, dict):
+        content: Any
+        # Fast path: a plain dict chunk with string content, the common
+        # streaming case, returns after two exact type checks
+        if type(chunk) is dict:
+            content = chunk.get("content", "")
+            if type(content) is str:
+                return content
+        elif isinstance(chunk, dict):
             content = chunk.get("content", "")
         else:
             content = getattr(chunk, "content", "")
@@ -733,66 +764,33 @@ class StreamProcessor:
             return content
         
         # Handle complex content
-        text_parts = []
-        if hasattr(content, '__iter__') and not isinstance(content, str):
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    text_parts.append(item.get("text", ""))
-        
-        return "".join(text_parts)
+        if not hasattr(content, "__iter__"):
+            return ""
+        return "".join(
+            item.get("text", "")
+            for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        )
     
-    def _create_start_event(self) -> UIMessageChunkStart:
-        """Create stream start event."""
-        return {
-            "type": "start",
-            "messageId": self.message_id
-        }
-    
-    def _create_finish_event(self) -> UIMessageChunkFinish:
-        """Create stream finish event."""
-        return {
-            "type": "finish",
-            "finishReason": "stop",
-            "usage": self.current_usage.copy()
-        }
-    
-    def _create_finish_step_event(self) -> UIMessageChunkFinishStep:
-        """Create finish step event."""
-        # Determine finish reason based on whether tools were used
-        finish_reason = "tool-calls" if self.tool_completed_in_current_step else "stop"
-        
-        # Use actual usage values from LangChain events
-        usage = self.current_usage.copy()
-        
-        return {
-            "type": "finish-step",
-            "finishReason": finish_reason,
-            "usage": usage,
-            "isContinued": False
-        }
+    # Stream lifecycle events share the chunk factories above
+    _create_start_event = _create_start_chunk
+    _create_finish_event = _create_finish_chunk
+    _create_finish_step_event = _create_finish_step_chunk
     
     async def _handle_ai_sdk_callbacks(self, callback_handler: BaseAICallbackHandler) -> None:
         """Handle AI SDK compatible callbacks."""
         # Use MessageBuilder to get the final message with all parts (including manual ones)
         message = self.message_builder.build_message()
         
-        # Filter out empty TextUIParts from message parts
-        from .callbacks import TextUIPart
-        filtered_parts = []
-        for part in message.parts:
-            if isinstance(part, TextUIPart):
-                # Only include TextUIPart if it has non-empty text
-                if part.text and part.text.strip():
-                    filtered_parts.append(part)
-            else:
-                # Include all non-TextUIPart parts
-                filtered_parts.append(part)
-        
-        # Update message with filtered parts
-        message.parts = filtered_parts
+        # Filter out empty TextUIParts from message parts; isspace() checks for
+        # whitespace-only text without allocating a stripped copy
+        message.parts = [
+            part for part in message.parts
+            if not (isinstance(part, TextUIPart) and (not part.text or part.text.isspace()))
+        ]
         
         # Create options with usage info (if available)
-        options = {}
+        options: Dict[str, Any] = {}
         
         # Call on_finish callback
         await callback_handler.on_finish(message, options)
\ No newline at end of file
@@ -48,7 +48,7 @@ class TextProcessingAdapter:
             
             if not self._text_started:
                 # Start new text sequence
-                self.current_text_id = str(uuid.uuid4())
+                self.current_text_id = uuid.uuid4().hex
                 self._text_started = True
                 chunks.append({
                     "type": "text-start",
@@ -113,7 +113,7 @@ class TextProcessingAdapter:
             } for chunk in text_chunks]
         else:
             # v5: Complete start/delta/end sequence
-            text_id = str(uuid.uuid4())
+            text_id = uuid.uuid4().hex
             chunks = [{"type": "text-start", "id": text_id}]
             
             for chunk in text_chunks:
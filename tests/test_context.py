@@ -0,0 +1,68 @@
+"""Tests for DataStreamContext."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_aisdk_adapter.context import DataStreamContext
+
+
+class TestDataStreamContext:
+    """Test cases for DataStreamContext emitters."""
+
+    @pytest.mark.asyncio
+    async def test_emit_without_stream_skips_work(self):
+        """Test that emitters return False without building chunks when no stream is set."""
+        DataStreamContext.clear_current_stream()
+
+        with patch("langchain_aisdk_adapter.context._random_id") as random_id:
+            assert await DataStreamContext.emit_text_delta("hi") is False
+            assert await DataStreamContext.emit_start() is False
+
+        random_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_emit_with_stream(self):
+        """Test that emitters forward chunks to the current stream."""
+        stream = MagicMock()
+        stream.emit_raw_data = AsyncMock()
+        token = DataStreamContext.set_current_stream(stream)
+        try:
+            assert await DataStreamContext.emit_text_delta("hi", text_id="t1") is True
+        finally:
+            DataStreamContext.clear_current_stream(token)
+
+        chunk = stream.emit_raw_data.call_args.args[0]
+        assert chunk["type"] == "text-delta"
+        assert chunk["id"] == "t1"
+        assert DataStreamContext.get_current_stream() is None
+
+    @pytest.mark.asyncio
+    async def test_emit_defaults_to_stream_message_id(self):
+        """Test that emitters without a message_id reuse the current stream's ID."""
+        stream = MagicMock()
+        stream.message_id = "msg-1"
+        stream.emit_raw_data = AsyncMock()
+        token = DataStreamContext.set_current_stream(stream)
+        try:
+            with patch("langchain_aisdk_adapter.context._random_id") as random_id:
+                await DataStreamContext.emit_start()
+                await DataStreamContext.emit_text_delta("hi", text_id="t1")
+        finally:
+            DataStreamContext.clear_current_stream(token)
+
+        random_id.assert_not_called()
+        chunks = [call.args[0] for call in stream.emit_raw_data.call_args_list]
+        assert [chunk["messageId"] for chunk in chunks] == ["msg-1", "msg-1"]
+
+    def test_random_id_is_unique_uuid4_hex(self):
+        """Test that pooled IDs are distinct uuid4-style hex strings across refills."""
+        import uuid
+        from langchain_aisdk_adapter.context import _ID_BATCH, _random_id
+
+        ids = [_random_id() for _ in range(_ID_BATCH * 2 + 1)]
+        assert len(set(ids)) == len(ids)
+        for value in ids:
+            parsed = uuid.UUID(hex=value)
+            assert parsed.hex == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
@@ -276,6 +276,210 @@ class TestDataStreamWithEmitters:
         
         assert len(chunks) >= 0
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_source_stream(self, sample_stream):
+        """Test that aclose closes the wrapped stream and marks the stream closed."""
+        source = sample_stream()
+        data_stream = DataStreamWithEmitters(
+            stream_generator=source,
+            message_id="test-id"
+        )
+
+        assert await source.__anext__() == {"type": "start", "messageId": "test-id"}
+        await data_stream.aclose()
+
+        assert data_stream._closed is True
+        with pytest.raises(StopAsyncIteration):
+            await source.__anext__()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output_format", ["chunks", "protocol"])
+    async def test_close_mid_iteration(self, output_format):
+        """Test that closing mid-iteration stops the producers and closes the source."""
+        closed = []
+
+        async def endless_stream():
+            try:
+                while True:
+                    yield {"type": "data", "data": [1]}
+                    await asyncio.sleep(0)
+            finally:
+                closed.append(True)
+
+        for close_stream in (True, False):
+            closed.clear()
+            data_stream = DataStreamWithEmitters(
+                stream_generator=endless_stream(),
+                message_id="test-id",
+                output_format=output_format
+            )
+            iterator = data_stream.__aiter__()
+            await iterator.__anext__()
+            if close_stream:
+                # Closing the stream itself ends the running iteration once
+                # the chunks produced before the close are drained
+                await data_stream.aclose()
+
+                async def drain():
+                    return [chunk async for chunk in iterator]
+
+                await asyncio.wait_for(drain(), timeout=0.5)
+            else:
+                await iterator.aclose()
+
+            assert closed == [True]
+            assert data_stream._closed is True
+            assert all(task.done() for task in data_stream._producer_tasks)
+
+    @pytest.mark.asyncio
+    async def test_queued_manual_chunks_keep_order(self):
+        """Test that manual chunks emitted in a burst are all forwarded in order."""
+        async def empty_stream():
+            return
+            yield
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=empty_stream(),
+            message_id="test-id",
+            output_format="chunks"
+        )
+        for index in range(5):
+            await data_stream.emit_raw_data({"type": "data", "index": index})
+
+        chunks = [chunk async for chunk in data_stream]
+        assert [chunk["index"] for chunk in chunks] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_upstream_is_read_ahead_of_consumer(self):
+        """Test that upstream chunks are consumed while the caller is busy elsewhere."""
+        pulled = []
+
+        async def upstream():
+            for index in range(3):
+                pulled.append(index)
+                yield {"type": "data", "index": index}
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=upstream(),
+            message_id="test-id",
+            output_format="chunks"
+        )
+        iterator = data_stream.__aiter__()
+        await iterator.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert pulled == [0, 1, 2]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_max_buffered_chunks_holds_back_emits(self):
+        """Test that emits wait for the reader once max_buffered_chunks are unread."""
+        async def empty_stream():
+            return
+            yield
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=empty_stream(),
+            message_id="test-id",
+            output_format="chunks",
+            max_buffered_chunks=2
+        )
+
+        async def emit_all():
+            for index in range(5):
+                await data_stream.emit_raw_data({"type": "data", "index": index})
+
+        emitter = asyncio.create_task(emit_all())
+        await asyncio.sleep(0)
+        assert len(data_stream._manual_chunks) == 2
+        assert not emitter.done()
+
+        chunks = [chunk async for chunk in data_stream]
+        await emitter
+        assert [chunk["index"] for chunk in chunks] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_text_delta_coalescing(self):
+        """Test that deltas within the coalescing window are emitted as one chunk, in order."""
+        async def empty_stream():
+            return
+            yield
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=empty_stream(),
+            message_id="test-id",
+            output_format="chunks",
+            text_delta_coalesce_ms=1000
+        )
+        for delta in ("Hel", "lo", " world"):
+            await data_stream.emit_text_delta(delta, text_id="t1")
+        await data_stream.emit_text_end("Hello world", text_id="t1")
+
+        chunks = [chunk async for chunk in data_stream]
+        assert [(chunk["type"], chunk.get("delta")) for chunk in chunks] == [
+            ("text-delta", "Hello world"),
+            ("text-end", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_text_delta_coalescing_without_text_id(self):
+        """Test that deltas without a text ID join the deltas already held."""
+        async def empty_stream():
+            return
+            yield
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=empty_stream(),
+            message_id="test-id",
+            output_format="chunks",
+            text_delta_coalesce_ms=1000
+        )
+        await data_stream.emit_text_delta("Hel")
+        await data_stream.emit_text_delta("lo")
+        await data_stream.emit_raw_data({"type": "data"})
+
+        chunks = [chunk async for chunk in data_stream]
+        assert [chunk["type"] for chunk in chunks] == ["text-delta", "data"]
+        assert chunks[0]["delta"] == "Hello"
+        assert chunks[0]["id"]
+
+    @pytest.mark.asyncio
+    async def test_text_delta_flush_waits_for_buffer_space(self):
+        """Test that switching text IDs flushes held deltas within max_buffered_chunks."""
+        async def empty_stream():
+            return
+            yield
+
+        data_stream = DataStreamWithEmitters(
+            stream_generator=empty_stream(),
+            message_id="test-id",
+            output_format="chunks",
+            max_buffered_chunks=1,
+            text_delta_coalesce_ms=1000
+        )
+        await data_stream.emit_raw_data({"type": "data", "index": 0})
+        await data_stream.emit_text_delta("a", text_id="t1")
+
+        emitter = asyncio.create_task(data_stream.emit_text_delta("b", text_id="t2"))
+        await asyncio.sleep(0)
+        assert len(data_stream._manual_chunks) == 1
+        assert not emitter.done()
+
+        async def finish():
+            await emitter
+            await data_stream.emit_text_end("b", text_id="t2")
+
+        finisher = asyncio.create_task(finish())
+        chunks = [chunk async for chunk in data_stream]
+        await finisher
+        assert [(chunk["type"], chunk.get("delta")) for chunk in chunks] == [
+            ("data", None),
+            ("text-delta", "a"),
+            ("text-delta", "b"),
+            ("text-end", None),
+        ]
+
 
 class TestDataStreamWriter:
     """Test cases for DataStreamWriter class."""
@@ -323,6 +527,18 @@ class TestDataStreamWriter:
         assert len(written_chunks) == 4
         assert written_chunks == chunks
 
+    @pytest.mark.asyncio
+    async def test_write_many(self):
+        """Test that write_many records and queues chunks in order."""
+        writer = DataStreamWriter()
+        chunks = [{"type": "text-delta", "textDelta": str(i)} for i in range(3)]
+
+        await writer.write_many(chunk for chunk in chunks)
+        await writer.close()
+
+        assert writer.get_chunks() == chunks
+        assert [chunk async for chunk in writer] == chunks
+
     @pytest.mark.asyncio
     async def test_concurrent_writes(self):
         """Test concurrent writes to DataStreamWriter."""
@@ -341,6 +557,50 @@ class TestDataStreamWriter:
         assert len(chunks) == 10
 
 
+class TestIterReadyBatches:
+    """Test cases for the shared read-ahead batching helper."""
+
+    @pytest.mark.asyncio
+    async def test_batches_ready_chunks_up_to_limit(self):
+        """Test that queued chunks are batched up to the limit, in order."""
+        from langchain_aisdk_adapter.data_stream import _iter_ready_batches
+
+        async def source():
+            for index in range(5):
+                yield index
+
+        batches = []
+        async for batch in _iter_ready_batches(source(), limit=2, flush_ms=50):
+            batches.append(batch)
+
+        assert [index for batch in batches for index in batch] == list(range(5))
+        assert all(len(batch) <= 2 for batch in batches)
+
+    @pytest.mark.asyncio
+    async def test_early_close_stops_reader(self):
+        """Test that closing the batches early cancels and awaits the reader task."""
+        from langchain_aisdk_adapter.data_stream import _iter_ready_batches
+
+        closed = []
+
+        async def endless():
+            try:
+                while True:
+                    yield "chunk"
+                    await asyncio.sleep(0)
+            finally:
+                closed.append(True)
+
+        batches = _iter_ready_batches(endless())
+        await batches.__anext__()
+        await batches.aclose()
+
+        assert closed == [True]
+        assert [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ] == []
+
+
 class TestDataStreamResponse:
     """Test cases for DataStreamResponse class."""
 
@@ -414,6 +674,41 @@ class TestDataStreamResponse:
         # Should handle gracefully
         assert response.protocol_config.version == "v4"
 
+    @pytest.mark.asyncio
+    async def test_preformatted_chunks_pass_through(self):
+        """Test that already-formatted text and bytes chunks are forwarded as-is."""
+        async def formatted_stream():
+            yield '0:"Hello"\n'
+            yield b'0:" world"\n'
+
+        response = DataStreamResponse(
+            stream=formatted_stream(),
+            protocol_version="v4"
+        )
+
+        body = [chunk async for chunk in response.body_iterator]
+        assert body[:2] == ['0:"Hello"\n', b'0:" world"\n']
+
+    @pytest.mark.asyncio
+    async def test_batch_bytes_joins_ready_chunks(self):
+        """Test that batch_bytes joins available chunks into byte buffers of bounded size."""
+        parts = [f'0:"{i}"\n' for i in range(10)]
+
+        async def formatted_stream():
+            for part in parts:
+                yield part
+
+        response = DataStreamResponse(
+            stream=formatted_stream(),
+            protocol_version="v4",
+            batch_bytes=12
+        )
+
+        body = [chunk async for chunk in response.body_iterator]
+        assert all(isinstance(chunk, bytes) for chunk in body)
+        assert b"".join(body).startswith("".join(parts).encode())
+        assert body[0] == "".join(parts[:2]).encode()
+
     def test_protocol_version_v5(self, sample_chunks):
         """Test with v5 protocol version."""
         async def chunk_stream():
@@ -110,6 +110,72 @@ class TestLangChainAdapter:
             
             mock_response.assert_called_once()
 
+    @pytest.mark.parametrize("auto_context", [True, False])
+    def test_to_data_stream_response_processes_stream_once(self, mock_async_stream, auto_context):
+        """Test that the response path creates a single processed stream."""
+        from langchain_aisdk_adapter.stream_processor import StreamProcessor
+
+        original = StreamProcessor.process_stream
+        with patch.object(
+            StreamProcessor, "process_stream", autospec=True, side_effect=original
+        ) as process_stream:
+            LangChainAdapter.to_data_stream_response(
+                stream=mock_async_stream([]),
+                options={"auto_context": auto_context}
+            )
+
+        assert process_stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_response_stream_sets_context_while_iterating(self):
+        """Test that the response stream exposes the context only while it runs."""
+        from langchain_aisdk_adapter.context import DataStreamContext
+
+        seen = []
+
+        async def upstream():
+            seen.append(DataStreamContext.get_current_stream())
+            yield {"event": "on_chat_model_stream", "data": {"chunk": {"content": "hi"}}}
+
+        response = LangChainAdapter.to_data_stream_response(stream=upstream())
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        assert chunks
+        assert isinstance(seen[0], DataStreamWithEmitters)
+        assert DataStreamContext.get_current_stream() is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("auto_context", [True, False])
+    async def test_response_reads_upstream_ahead_of_client(self, auto_context):
+        """Test that the response keeps reading upstream while the client is slow."""
+        import asyncio
+
+        pulled = []
+        closed = []
+
+        async def upstream():
+            try:
+                for text in ("a", "b", "c"):
+                    pulled.append(text)
+                    yield {"event": "on_chat_model_stream", "data": {"chunk": {"content": text}}}
+                # Wait for a client that never asks for more
+                await asyncio.Event().wait()
+                yield {"event": "on_chat_model_stream", "data": {"chunk": {"content": "d"}}}
+            finally:
+                closed.append(True)
+
+        response = LangChainAdapter.to_data_stream_response(
+            stream=upstream(), options={"auto_context": auto_context}
+        )
+        body = response.body_iterator
+        await body.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert pulled == ["a", "b", "c"]
+        await body.aclose()
+        assert closed == [True]
+
     @pytest.mark.asyncio
     async def test_merge_into_data_stream(self, mock_async_stream):
         """Test merge_into_data_stream functionality."""
@@ -127,8 +193,61 @@ class TestLangChainAdapter:
             message_id="test-merge-id"
         )
         
-        # Verify that write was called
-        assert mock_writer.write.called
+        # Verify that chunks were written, singly or as a batch
+        assert mock_writer.write.called or mock_writer.write_many.called
+
+    @pytest.mark.asyncio
+    async def test_merge_into_data_stream_without_context(self, mock_async_stream):
+        """Test that merging without auto_context writes the same protocol output."""
+        stream_items = [
+            {"event": "on_chat_model_stream", "data": {"chunk": {"content": "test"}}}
+        ]
+
+        with_context = DataStreamWriter()
+        await LangChainAdapter.merge_into_data_stream(
+            stream=mock_async_stream(list(stream_items)),
+            data_stream_writer=with_context,
+            message_id="test-merge-id",
+            options={"protocol_version": "v5"}
+        )
+
+        without_context = DataStreamWriter()
+        await LangChainAdapter.merge_into_data_stream(
+            stream=mock_async_stream(stream_items),
+            data_stream_writer=without_context,
+            message_id="test-merge-id",
+            options={"protocol_version": "v5", "auto_context": False}
+        )
+
+        chunks = without_context.get_chunks()
+        assert chunks
+        assert all(isinstance(chunk, str) for chunk in chunks)
+        # Text IDs differ per processor, so compare everything but text chunks
+        def non_text(chunks):
+            return [c for c in chunks if '"text-' not in c]
+        assert any('"text-delta"' in c and '"test"' in c for c in chunks)
+        assert non_text(chunks) == non_text(with_context.get_chunks())
+
+    @pytest.mark.asyncio
+    async def test_merge_batch_options(self, mock_async_stream):
+        """Test that merge batches respect merge_batch_size and keep all chunks."""
+        stream_items = [
+            {"event": "on_chat_model_stream", "data": {"chunk": {"content": f"t{i} "}}}
+            for i in range(6)
+        ]
+        writer = DataStreamWriter()
+        writer.write_many = AsyncMock(wraps=writer.write_many)
+
+        await LangChainAdapter.merge_into_data_stream(
+            stream=mock_async_stream(stream_items),
+            data_stream_writer=writer,
+            options={"merge_batch_size": 3, "merge_flush_ms": 20}
+        )
+
+        assert writer.write_many.called
+        assert all(len(call.args[0]) <= 3 for call in writer.write_many.call_args_list)
+        text = "".join(writer.get_chunks())
+        assert all(f"t{i} " in text for i in range(6))
 
     @pytest.mark.asyncio
     async def test_auto_generated_message_id(self, mock_async_stream):
@@ -147,6 +266,54 @@ class TestLangChainAdapter:
         # Try to parse as UUID to verify format
         uuid.UUID(result.message_id)
 
+    @pytest.mark.asyncio
+    async def test_fast_message_id_option(self, mock_async_stream):
+        """Test that fast_message_id generates distinct non-UUID message IDs."""
+        options: AdapterOptions = {"fast_message_id": True}
+
+        first = LangChainAdapter.to_data_stream(
+            stream=mock_async_stream([]), options=options
+        )
+        second = LangChainAdapter.to_data_stream(
+            stream=mock_async_stream([]), options=options
+        )
+
+        assert first.message_id
+        assert first.message_id != second.message_id
+        with pytest.raises(ValueError):
+            uuid.UUID(first.message_id)
+
+    def test_fast_message_id_prefix_is_random_per_process(self):
+        """Test that cheap IDs use a random prefix that changes in forked children."""
+        import os
+        from langchain_aisdk_adapter import langchain_adapter
+
+        prefix = langchain_adapter._cheap_message_id().split("-")[0]
+        assert prefix != f"{os.getpid():x}"
+
+        langchain_adapter._reset_cheap_message_ids()
+        child_prefix, counter = langchain_adapter._cheap_message_id().split("-")
+        assert child_prefix != prefix
+        assert counter == "0"
+
+    @pytest.mark.asyncio
+    async def test_generate_message_id_option(self, mock_async_stream):
+        """Test that experimental_generateMessageId only runs without a message_id."""
+        generate = MagicMock(return_value="generated-id")
+        options: AdapterOptions = {"experimental_generateMessageId": generate}
+
+        explicit = LangChainAdapter.to_data_stream(
+            stream=mock_async_stream([]), message_id="given-id", options=options
+        )
+        assert explicit.message_id == "given-id"
+        generate.assert_not_called()
+
+        generated = LangChainAdapter.to_data_stream(
+            stream=mock_async_stream([]), options=options
+        )
+        assert generated.message_id == "generated-id"
+        generate.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_error_handling(self, mock_callback_handler):
         """Test error handling in stream processing."""
@@ -180,6 +347,36 @@ class TestLangChainAdapter:
         assert protocol_version == "v4"
         assert auto_events is True
 
+    def test_parse_options_cached(self):
+        """Test that equal options share one parsed result and unhashable values still parse."""
+        from langchain_aisdk_adapter.langchain_adapter import _parse_options
+
+        first = _parse_options({"protocol_version": "v5", "auto_context": False})
+        second = _parse_options({"auto_context": False, "protocol_version": "v5"})
+        assert first is second
+        assert first.protocol_version == "v5"
+        assert first.auto_events is True
+
+        unhashable = _parse_options({"protocol_version": "v5", "extra": []})
+        assert unhashable.protocol_version == "v5"
+
+    def test_parse_options_does_not_cache_callables(self):
+        """Test that options holding callables are parsed without being cached."""
+        import gc
+        import weakref
+        from langchain_aisdk_adapter.langchain_adapter import _parse_options
+
+        def generate():
+            return "generated-id"
+
+        parsed = _parse_options({"experimental_generateMessageId": generate})
+        assert parsed.experimental_generateMessageId is generate
+
+        ref = weakref.ref(generate)
+        del generate, parsed
+        gc.collect()
+        assert ref() is None
+
     @pytest.mark.asyncio
     async def test_string_stream_handling(self):
         """Test handling of direct string streams."""
@@ -222,4 +419,9 @@ class TestLangChainAdapter:
                 break
         
         # Verify callbacks were called (exact calls depend on implementation)
-        assert mock_callback_handler.on_start.called or mock_callback_handler.on_finish.called
\ No newline at end of file
+        assert mock_callback_handler.on_start.called or mock_callback_handler.on_finish.called
+
+    def test_enable_uvloop_without_uvloop(self):
+        """Test that enable_uvloop reports False when uvloop is not installed."""
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert LangChainAdapter.enable_uvloop() is False
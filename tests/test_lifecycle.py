@@ -0,0 +1,29 @@
+"""Tests for ContextLifecycleManager."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from langchain_aisdk_adapter.context import DataStreamContext
+from langchain_aisdk_adapter.lifecycle import ContextLifecycleManager
+
+
+class TestContextLifecycleManager:
+    """Test cases for ContextLifecycleManager wrappers."""
+
+    @pytest.mark.asyncio
+    async def test_context_wrapper_sync_and_async(self):
+        """Test that wrapped sync and async functions run with the stream set."""
+        stream = MagicMock()
+        wrap = ContextLifecycleManager.create_context_wrapper(stream)
+
+        @wrap
+        def sync_func(value):
+            return value, DataStreamContext.get_current_stream()
+
+        @wrap
+        async def async_func(value):
+            return value, DataStreamContext.get_current_stream()
+
+        assert await sync_func(1) == (1, stream)
+        assert await async_func(2) == (2, stream)
+        assert DataStreamContext.get_current_stream() is None
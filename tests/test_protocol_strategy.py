@@ -1,5 +1,7 @@
 """Tests for protocol strategy classes."""
 
+import json
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -227,6 +229,18 @@ class TestAISDKv5Strategy:
         result = strategy.format_chunk(chunk)
         assert isinstance(result, str)
 
+    @pytest.mark.parametrize("chunk", [
+        {"type": "text-delta", "id": "text-1", "delta": 'Say "hi"\n ☃'},
+        {"type": "text-delta", "delta": "reordered", "id": "text-1"},
+        {"type": "text-delta", "id": "text-1", "delta": "x", "providerMetadata": {}},
+    ])
+    def test_format_chunk_text_delta_v5_matches_json(self, chunk):
+        """Test that text-delta output matches a full json.dumps of the chunk."""
+        strategy = AISDKv5Strategy()
+
+        expected = f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        assert strategy.format_chunk(chunk) == expected
+
     def test_convert_text_sequence_v5(self):
         """Test converting text sequence in v5 protocol."""
         strategy = AISDKv5Strategy()
@@ -279,6 +293,11 @@ class TestProtocolConfig:
         assert config.version == "v4"
         assert isinstance(config.strategy, AISDKv4Strategy)
 
+    def test_strategy_is_shared_per_version(self):
+        """Test that configs for the same version reuse one stateless strategy."""
+        assert ProtocolConfig("v4").strategy is ProtocolConfig("v4").strategy
+        assert ProtocolConfig("v4").strategy is not ProtocolConfig("v5").strategy
+
     def test_strategy_delegation(self):
         """Test that ProtocolConfig properly delegates to strategy."""
         config = ProtocolConfig("v4")
@@ -0,0 +1,119 @@
+"""Tests for smooth_stream module."""
+
+import asyncio
+import re
+
+import pytest
+
+from langchain_aisdk_adapter.smooth_stream import (
+    SmoothStreamTransformer,
+    apply_smooth_stream,
+    create_smooth_text_stream,
+)
+
+
+async def _text_stream(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestSmoothStreamTransformer:
+    """Test cases for SmoothStreamTransformer chunking."""
+
+    @pytest.mark.asyncio
+    async def test_word_chunking(self):
+        """Test that word chunking emits whole words and flushes the tail."""
+        chunks = await _collect(apply_smooth_stream(
+            _text_stream("Hel", "lo wor", "ld again"), delay_in_ms=0, chunking='word'
+        ))
+
+        assert chunks == ["Hello ", "world ", "again"]
+
+    @pytest.mark.asyncio
+    async def test_line_chunking(self):
+        """Test that line chunking splits on newlines only."""
+        chunks = await _collect(apply_smooth_stream(
+            _text_stream("one\ntw", "o\r\nthree"), delay_in_ms=0, chunking='line'
+        ))
+
+        assert chunks == ["one\n", "two\r\n", "three"]
+
+    @pytest.mark.asyncio
+    async def test_line_chunking_ignores_other_line_breaks(self):
+        """Test that only newlines end a line, unlike str.splitlines."""
+        chunks = await _collect(apply_smooth_stream(
+            _text_stream("a\rb\u2028c\x0cd\n", "e"), delay_in_ms=0, chunking='line'
+        ))
+
+        assert chunks == ["a\rb\u2028c\x0cd\n", "e"]
+
+    @pytest.mark.asyncio
+    async def test_regex_chunking(self):
+        """Test that regex chunking emits text up to and including each match."""
+        pattern = re.compile(r'[.!?]+\s*')
+        chunks = await _collect(create_smooth_text_stream(
+            "Hi. How are you? Fine", delay_in_ms=0, chunking=pattern
+        ))
+
+        assert "".join(chunks) == "Hi. How are you? Fine"
+        assert chunks[:2] == ["Hi", ". "]
+
+    @pytest.mark.asyncio
+    async def test_protocol_chunks(self):
+        """Test that dict text chunks are chunked and other chunks pass through."""
+        stream = _text_stream(
+            {"type": "text", "content": "a b"},
+            {"type": "other"},
+        )
+        chunks = await _collect(SmoothStreamTransformer(stream, 0, 'word'))
+
+        assert chunks == [
+            {"type": "text", "content": "a "},
+            {"type": "other"},
+            {"type": "text", "content": "b"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delay_spaces_chunks(self):
+        """Test that consecutive chunks are at least delay_in_ms apart."""
+        loop = asyncio.get_running_loop()
+        times = []
+        async for _ in create_smooth_text_stream("a b c", delay_in_ms=20):
+            times.append(loop.time())
+
+        assert len(times) == 3
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert all(gap >= 0.015 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_slow_producer_is_not_delayed(self, monkeypatch):
+        """Test that no sleep happens when chunks arrive slower than the delay."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        loop = asyncio.get_running_loop()
+        clock = iter(range(0, 1000, 10))
+        monkeypatch.setattr(loop, "time", lambda: next(clock))
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        chunks = await _collect(apply_smooth_stream(
+            _text_stream("a ", "b ", "c"), delay_in_ms=1000
+        ))
+
+        assert chunks == ["a ", "b ", "c"]
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_word_chunking_without_spaces(self):
+        """Test that text without separators is held until one arrives."""
+        chunks = await _collect(apply_smooth_stream(
+            _text_stream("你好", "世界", "！ 再见"), delay_in_ms=0, chunking='word'
+        ))
+
+        assert chunks == ["你好世界！ ", "再见"]